@@ -1,5 +1,38 @@
+from typing import Any, Callable, Generic, Self, TypeVar, overload
+
 from pydantic import BaseModel
 
+T = TypeVar("T")
+
+
+class fast_cached_property(Generic[T]):
+    """Lock-free alternative to ``functools.cached_property`` for derived values on frozen models.
+
+    The computed value is stored in the instance ``__dict__`` on first access and is then found there before this
+    (non-data) descriptor is consulted. Not for use with ``computed_field``, which requires ``cached_property``.
+    """
+
+    def __init__(self, func: Callable[[Any], T]) -> None:
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type | None = None) -> Self: ...
+
+    @overload
+    def __get__(self, instance: object, owner: type | None = None) -> T: ...
+
+    def __get__(self, instance: object | None, owner: type | None = None) -> T | Self:
+        if instance is None:
+            return self
+        value = self.func(instance)
+        instance.__dict__[self.name] = value
+        return value
+
 
 class AeBaseModel(BaseModel):
-    model_config = {"frozen": True}
+    model_config = {"frozen": True, "ignored_types": (fast_cached_property,)}
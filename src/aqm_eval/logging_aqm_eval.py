@@ -114,6 +114,23 @@ class LoggerWrapper:
         self.logger = logging.getLogger(_PROJECT_NAME)
         self("Logging initialized", level=logging.INFO)
 
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether a message at `level` would be emitted.
+
+        Use this to skip building expensive log messages (e.g. dataset reprs) that would be discarded.
+
+        Parameters
+        ----------
+        level : int
+            The message level to check.
+
+        Returns
+        -------
+        bool
+            `True` if messages at `level` are emitted.
+        """
+        return self._get_logger_().isEnabledFor(level)
+
     def _get_logger_(self) -> logging.Logger:
         if self.logger is None:
             raise ValueError
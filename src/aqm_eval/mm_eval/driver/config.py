@@ -2,17 +2,24 @@ import logging
 from copy import deepcopy
 from datetime import datetime
 from enum import StrEnum, unique
-from functools import cached_property
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Mapping
 
 import yaml
-from pydantic import Field, model_validator
+from pydantic import Field, ModelWrapValidatorHandler, model_validator
 
-from aqm_eval.base import AeBaseModel
+from aqm_eval.base import AeBaseModel, fast_cached_property
 from aqm_eval.logging_aqm_eval import LOGGER
 from aqm_eval.settings import SETTINGS
-from aqm_eval.shared import DateRange, get_str_nested, set_str_nested, update_left
+from aqm_eval.shared import YAML_SAFE_LOADER, DateRange, update_left
+
+
+@lru_cache(maxsize=4)
+def _load_yaml_(path: Path) -> dict:
+    # Parsed once per process; callers must copy before modifying.
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=YAML_SAFE_LOADER)
 
 
 @unique
@@ -23,13 +30,15 @@ class ScorecardMethod(StrEnum):
     NME = "nme"
 
     def get_mm_prefix(self) -> str:
-        mapping = {
-            ScorecardMethod.IOA: "pg72",
-            ScorecardMethod.NMB: "pg73",
-            ScorecardMethod.NME: "pg74",
-            ScorecardMethod.RMSE: "pg71",
-        }
-        return mapping[self]
+        return _SCORECARD_MM_PREFIX[self]
+
+
+_SCORECARD_MM_PREFIX: dict[ScorecardMethod, str] = {
+    ScorecardMethod.IOA: "pg72",
+    ScorecardMethod.NMB: "pg73",
+    ScorecardMethod.NME: "pg74",
+    ScorecardMethod.RMSE: "pg71",
+}
 
 
 @unique
@@ -74,6 +83,10 @@ class PlatformKey(StrEnum):
     LOCAL = "local"
 
 
+_PACKAGE_KEY_VALUES: tuple[str, ...] = tuple(ii.value for ii in PackageKey)
+_TASK_KEY_VALUES: tuple[str, ...] = tuple(ii.value for ii in TaskKey)
+
+
 def _is_unique_(v: tuple[Any, ...]) -> tuple[Any, ...]:
     if len(set(v)) != len(v):
         raise ValueError("Values must be unique.")
@@ -140,7 +153,7 @@ class PlotKwargs(AeBaseModel):
 
 class TaskDefaults(AeBaseModel):
     execution: Execution = Field(description="Default execution settings for all tasks.")
-    save_paired: dict = Field(default={}, description="Default save paired settings (SavePairedTask model).")
+    save_paired: dict = Field(default={}, description="Default save paired settings (analysis section of the TaskTemplate model).")
     timeseries: dict = Field(default={}, description="Default save paired settings (Plot model).")
 
 
@@ -160,12 +173,13 @@ class AQMModelConfig(AeBaseModel):
     variables: Any | None = None
     projection: Any | None = None
 
-    @model_validator(mode="before")
+    @model_validator(mode="wrap")
     @classmethod
-    def _validate_model_(cls, values: dict) -> dict:
-        if values.get("title") is None:
+    def _validate_model_(cls, values: Any, handler: ModelWrapValidatorHandler["AQMModelConfig"]) -> "AQMModelConfig":
+        # Fast path for the common case where a title is provided. Otherwise, fall back to the model key.
+        if isinstance(values, dict) and ("title" not in values or values["title"] is None):
             values["title"] = values["key"]
-        return values
+        return handler(values)
 
 
 class AQMConfig(AeBaseModel):
@@ -194,24 +208,28 @@ class AQMConfig(AeBaseModel):
         "when possible; useful to avoid re-generating pre-processed data files)."
     )
 
-    @cached_property
+    @fast_cached_property
     def enable_scorecards(self) -> bool:
         return len(self.scorecards) > 0
 
-    @cached_property
+    @fast_cached_property
     def host_model(self) -> dict[str, AQMModelConfig]:
         for k, v in self.models.items():
             if v.is_host:
                 return {k: v}
         raise ValueError("No host model found.")
 
-    @cached_property
+    @fast_cached_property
     def n_models_to_evaluate(self) -> int:
         n_models = len(self.models)
         if self.no_forecast:
             n_models -= 1
         return n_models
 
+    @fast_cached_property
+    def _models_keyset(self) -> frozenset[str]:
+        return frozenset(self.models)
+
     @model_validator(mode="before")
     @classmethod
     def _validate_model_before_(cls, values: dict) -> dict:
@@ -225,8 +243,9 @@ class AQMConfig(AeBaseModel):
 
     @model_validator(mode="after")
     def _validate_model_after_(self) -> "AQMConfig":
+        models_keyset = self._models_keyset
         for k, v in self.scorecards.items():
-            if v.control not in self.models or v.sensitivity not in self.models:
+            if v.control not in models_keyset or v.sensitivity not in models_keyset:
                 raise ValueError(f"Scorecard key={k} references non-existent model {v.control=} or {v.sensitivity=}.")
             if self.no_forecast and list(self.host_model.keys())[0] in [v.control, v.sensitivity]:
                 raise ValueError(f"Host model cannot be used for scorecard {k} since no_forecast is True.")
@@ -249,11 +268,11 @@ class AQMConfig(AeBaseModel):
             if v.key != k:
                 raise ValueError(f"Model key={k} does not match value.key={v.key}.")
 
-        is_host = set([k for k, v in values.items() if v.is_host])
+        is_host = {k for k, v in values.items() if v.is_host}
         if len(is_host) != 1:
             raise ValueError(f"Only one model can be host. Found {is_host}.")
 
-        if len(set([ii.title for ii in values.values()])) != len(values):
+        if len({ii.title for ii in values.values()}) != len(values):
             raise ValueError("Model titles must be unique.")
 
         if self.no_forecast:
@@ -289,7 +308,7 @@ class Config(AeBaseModel):
 
     _key: str = "melodies_monet_parm"
 
-    @cached_property
+    @fast_cached_property
     def date_range(self) -> DateRange:
         start = datetime.strptime(self.start_datetime, "%Y-%m-%d-%H:%M:%S")
         end = datetime.strptime(self.end_datetime, "%Y-%m-%d-%H:%M:%S")
@@ -306,8 +325,7 @@ class Config(AeBaseModel):
 
     @classmethod
     def from_default_yaml(cls, platform_key: PlatformKey, overrides: dict) -> "Config":
-        raw = (SETTINGS.eval_template_dir / "config-default.yaml").read_text()
-        data = yaml.safe_load(raw)[cls.get_key()]
+        data = cls.get_default_yaml()[cls.get_key()]
         update_left(data, overrides)
 
         root_aqm = data["aqm"]
@@ -315,33 +333,40 @@ class Config(AeBaseModel):
             LOGGER("removing default host model (key=eval) since another was provided", level=logging.WARNING)
             root_aqm["models"].pop("eval")
 
-        for package_key in PackageKey:
-            kp = f"aqm.packages.{package_key.value}.execution.prep.batchargs.tasks_per_node"
-            actual = get_str_nested(data, kp)
-            if actual == "auto":
-                data_kp = f"platform_defaults.{platform_key.value}.ncores_per_node"
-                set_str_nested(data, kp, get_str_nested(data, data_kp))
-            for task_key, task_value in get_str_nested(data, f"aqm.packages.{package_key.value}.execution.tasks").items():
-                if "tasks_per_node" not in task_value["batchargs"]:
-                    task_value["batchargs"]["tasks_per_node"] = get_str_nested(
-                        data, f"platform_defaults.{platform_key.value}.ncores_per_node"
-                    )
-
-            for task_key in TaskKey:
-                task_plot_lhs = deepcopy(root_aqm["task_defaults"].setdefault(task_key.value, {}))
-                task_plot_rhs = (
-                    root_aqm["packages"][package_key.value].setdefault("task_overlay", {}).setdefault(task_key.value, {})
-                )
-                update_left(task_plot_lhs, task_plot_rhs)
-                root_aqm["packages"][package_key.value].setdefault("task_mm_config", {})[task_key.value] = task_plot_lhs
-
-        if root_aqm["task_defaults"]["execution"]["batchargs"]["tasks_per_node"] == "auto":
-            root_aqm["task_defaults"]["execution"]["batchargs"]["tasks_per_node"] = get_str_nested(
-                data, f"platform_defaults.{platform_key.value}.ncores_per_node"
-            )
+        # Resolve the repeatedly used nodes once instead of walking dotted key paths per package and task.
+        ncores_per_node = data["platform_defaults"][platform_key.value]["ncores_per_node"]
+        task_defaults = root_aqm["task_defaults"]
+        for package_key in _PACKAGE_KEY_VALUES:
+            package = root_aqm["packages"][package_key]
+            execution = package["execution"]
+            prep_batchargs = execution["prep"]["batchargs"]
+            if prep_batchargs["tasks_per_node"] == "auto":
+                prep_batchargs["tasks_per_node"] = ncores_per_node
+            for task_value in execution["tasks"].values():
+                task_value["batchargs"].setdefault("tasks_per_node", ncores_per_node)
+
+            task_overlay = package.setdefault("task_overlay", {})
+            task_mm_config = package.setdefault("task_mm_config", {})
+            for task_key in _TASK_KEY_VALUES:
+                task_plot_lhs = deepcopy(task_defaults.setdefault(task_key, {}))
+                update_left(task_plot_lhs, task_overlay.setdefault(task_key, {}))
+                task_mm_config[task_key] = task_plot_lhs
+
+        if task_defaults["execution"]["batchargs"]["tasks_per_node"] == "auto":
+            task_defaults["execution"]["batchargs"]["tasks_per_node"] = ncores_per_node
 
         return cls.from_yaml({cls.get_key(): data})
 
+    @classmethod
+    def get_default_yaml(cls) -> dict:
+        """
+        Returns
+        -------
+        dict
+            A copy of the parsed ``config-default.yaml`` document. Safe to modify in place.
+        """
+        return deepcopy(_load_yaml_(SETTINGS.eval_template_dir / "config-default.yaml"))
+
     @classmethod
     def get_key(cls) -> str:
         return cls._key.default  # type: ignore[attr-defined]
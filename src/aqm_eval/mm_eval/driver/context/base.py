@@ -1,8 +1,8 @@
 """Base object definitions for driver contexts."""
 
 from abc import ABC, abstractmethod
-from functools import cached_property
 from pathlib import Path
+from typing import ClassVar
 
 from pydantic import model_validator
 
@@ -10,23 +10,38 @@ from aqm_eval.base import AeBaseModel
 from aqm_eval.logging_aqm_eval import LOGGER
 from aqm_eval.mm_eval.driver.config import Config
 
+_TEMPLATE_DIR = (Path(__file__).parent.parent.parent / "mm_eval_config").resolve()
+
 
 class AbstractDriverContext(ABC, AeBaseModel):
     """Abstract base class for all driver contexts. A "driver context" indicates the origin of the
     configuration.
     """
 
-    @cached_property
+    # Contexts are constructed once per CLI invocation, so build the validation schema on first use rather
+    # than at import.
+    model_config = {"frozen": True, "defer_build": True}
+
+    # Set to ``False`` on subclasses that should not build ``mm_config`` during validation.
+    _eager_validate: ClassVar[bool] = True
+    # Cached properties evaluated during validation so configuration errors surface when the context is built.
+    _eager_properties: ClassVar[tuple[str, ...]] = ("mm_config",)
+
+    @property
     @abstractmethod
     def mm_config(self) -> Config: ...
 
-    @cached_property
+    @property
     def template_dir(self) -> Path:
-        return (Path(__file__).parent.parent.parent / "mm_eval_config").absolute().resolve()
+        # Resolved once at import and shared by every context.
+        return _TEMPLATE_DIR
 
     @model_validator(mode="after")
     def _validate_(self) -> "AbstractDriverContext":
+        if not type(self)._eager_validate:
+            return self
+        for name in type(self)._eager_properties:
+            _ = getattr(self, name)
         if not self.mm_config.aqm.active:
             LOGGER(exc_info=ValueError("AQM evaluation is not active"))
-        _ = self.model_dump()
         return self
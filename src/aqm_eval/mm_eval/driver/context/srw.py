@@ -1,23 +1,42 @@
 """Implements the Short-Range Weather (SRW) App driver context."""
 
+import logging
+from copy import deepcopy
 from datetime import datetime
-from functools import cached_property
+from functools import lru_cache
 from pathlib import Path
+from typing import ClassVar
 
 import yaml
-from pydantic import computed_field
 from uwtools.api.config import get_yaml_config
 
-from aqm_eval.base import AeBaseModel
+from aqm_eval.base import AeBaseModel, fast_cached_property
+from aqm_eval.logging_aqm_eval import LOGGER
 from aqm_eval.mm_eval.driver.config import Config, PlatformKey
 from aqm_eval.mm_eval.driver.context.base import AbstractDriverContext
-from aqm_eval.settings import SETTINGS
-from aqm_eval.shared import assert_directory_exists, update_left
+from aqm_eval.shared import YAML_SAFE_LOADER, assert_directory_exists, resolve_path, update_left
 
 
-def _convert_date_string_to_mm_(date_str: str) -> str:
-    dt = datetime.strptime(date_str, "%Y%m%d%H")
-    return dt.strftime("%Y-%m-%d-%H:00:00")
+@lru_cache(maxsize=32)
+def _load_yaml_cached_(path: Path, mtime_ns: int, size: int) -> dict:
+    # The file's modification time and size are part of the cache key so edited files are re-parsed.
+    try:
+        with open(path, "rb") as f:
+            return yaml.load(f, Loader=YAML_SAFE_LOADER)
+    except yaml.constructor.ConstructorError:
+        # uwtools tags (e.g. ``!int``) are only understood by the uwtools loader.
+        LOGGER(f"falling back to uwtools YAML loader {path=}", level=logging.DEBUG)
+        return get_yaml_config(path).data
+
+
+def _load_yaml_(path: Path) -> dict:
+    stat = path.stat()
+    return _load_yaml_cached_(path, stat.st_mtime_ns, stat.st_size)
+
+
+def _format_mm_datetime_(dt: datetime) -> str:
+    # Equivalent to ``dt.strftime("%Y-%m-%d-%H:00:00")`` without going through the strftime format parser.
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}-{dt.hour:02d}:00:00"
 
 
 class SrwWorkflow(AeBaseModel):
@@ -41,46 +60,51 @@ class SRWContext(AbstractDriverContext):
     user: SrwUser
     melodies_monet_parm: dict
 
-    @computed_field
-    @cached_property
+    _eager_properties: ClassVar[tuple[str, ...]] = ("expt_dir", "mm_config")
+
+    @fast_cached_property
     def expt_dir(self) -> Path:
         return self.workflow.EXPT_BASEDIR / self.workflow.EXPT_SUBDIR
 
     @classmethod
     def from_expt_dir(cls, path: Path) -> "SRWContext":
         path = path / "var_defns.yaml"
-        data = get_yaml_config(path)["__mm_runtime__"]
+        # Copy the cached section since validation and config merging may mutate nested values.
+        data = deepcopy(_load_yaml_(path)["__mm_runtime__"])
         return cls.model_validate(data)
 
-    @cached_property
+    @fast_cached_property
     def _date_first_cycle_srw(self) -> str:
         return self.workflow.DATE_FIRST_CYCL
 
-    @cached_property
+    @fast_cached_property
     def _date_last_cycle_srw(self) -> str:
         return self.workflow.DATE_LAST_CYCL_MM
 
-    @cached_property
+    @fast_cached_property
     def _date_first_cycle_mm(self) -> str:
-        return _convert_date_string_to_mm_(self._date_first_cycle_srw)
+        return _format_mm_datetime_(self._datetime_first_cycl)
 
-    @cached_property
+    @fast_cached_property
     def _date_last_cycle_mm(self) -> str:
-        return _convert_date_string_to_mm_(self._date_last_cycle_srw)
+        return _format_mm_datetime_(self._datetime_last_cycl)
 
-    @cached_property
+    @fast_cached_property
     def _mm_output_dir_default(self) -> Path:
         return self.expt_dir / "mm_output"
 
-    @cached_property
+    @fast_cached_property
+    def _mm_run_dir_default(self) -> Path:
+        return self.expt_dir / "mm_run"
+
+    @fast_cached_property
     def _cartopy_data_dir(self) -> Path:
         target_dir = self.platform.FIXshp
-        return assert_directory_exists(target_dir).absolute().resolve(strict=True)
+        return resolve_path(assert_directory_exists(target_dir))
 
-    @cached_property
+    @fast_cached_property
     def mm_config(self) -> Config:
-        raw = (SETTINGS.eval_template_dir / "config-default.yaml").read_text()
-        mm_parm_left = yaml.safe_load(raw)["melodies_monet_parm"]
+        mm_parm_left = Config.get_default_yaml()[Config.get_key()]
         mm_parm_right = self.melodies_monet_parm
         update_left(mm_parm_left, mm_parm_right)
         mm_parm = {
@@ -101,7 +125,7 @@ class SRWContext(AbstractDriverContext):
         if root.get("output_dir") is None:
             root["output_dir"] = self._mm_output_dir_default
         if root.get("run_dir") is None:
-            root["run_dir"] = self.expt_dir / "mm_run"
+            root["run_dir"] = self._mm_run_dir_default
 
         if root.get("start_datetime") is None:
             root["start_datetime"] = self._date_first_cycle_mm
@@ -113,14 +137,14 @@ class SRWContext(AbstractDriverContext):
 
         return Config.from_default_yaml(self._platform, mm_parm["melodies_monet_parm"])
 
-    @cached_property
+    @fast_cached_property
     def _platform(self) -> PlatformKey:
         return PlatformKey(self.user.MACHINE.lower())
 
-    @cached_property
+    @fast_cached_property
     def _datetime_first_cycl(self) -> datetime:
         return datetime.strptime(self._date_first_cycle_srw, "%Y%m%d%H")
 
-    @cached_property
+    @fast_cached_property
     def _datetime_last_cycl(self) -> datetime:
         return datetime.strptime(self._date_last_cycle_srw, "%Y%m%d%H")
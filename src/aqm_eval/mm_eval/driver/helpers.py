@@ -1,10 +1,23 @@
 """Helper utilities for the MM evaluation driver."""
 
+import fnmatch
+import os
 import platform
+import re
+from functools import lru_cache
 from pathlib import Path
 
 from aqm_eval.logging_aqm_eval import LOGGER, log_it
-from aqm_eval.shared import DateRange
+from aqm_eval.shared import DateRange, get_or_create_path
+
+# Resolve the platform once at import rather than per linked file
+_link_file_ = os.link if platform.system() == "Windows" else os.symlink  # Hard links here for testing
+
+
+@lru_cache(maxsize=128)
+def _compile_fn_templates_(src_fn_template: tuple[str, ...]) -> re.Pattern[str]:
+    # Models linked by the same package share templates, so compile each combination once
+    return re.compile("|".join(f"(?:{fnmatch.translate(ii)})" for ii in src_fn_template) or "(?!)")
 
 
 @log_it
@@ -26,22 +39,28 @@ def create_symlinks(
         src_fn_template: Filename patterns to match
     """
     LOGGER(f"creating symlinks from {src_dir=} to {dst_dir=}")
-    if not dst_dir.exists():
-        LOGGER(f"creating destination directory {dst_dir=}")
-        dst_dir.mkdir(exist_ok=False, parents=True)
+    get_or_create_path(dst_dir)
+    # Snapshot existing destination names once instead of stat-ing every candidate link
+    with os.scandir(dst_dir) as it:
+        existing = {entry.name for entry in it}
+    # Match all filename templates with one compiled pattern
+    src_fn_regex = _compile_fn_templates_(tuple(src_fn_template))
     # Find directories matching src_dir_template
     ctr = 0
     for curr_dt in date_range.iter_by_step():
-        subdir = src_dir / date_range.to_srw_str(curr_dt)
-        # Find files in matching directories that match src_fn_template
-        for fn_pattern in src_fn_template:
-            for src_file in subdir.glob(fn_pattern):
-                # Create symlink if it doesn't already exist
-                dst_file = dst_dir / f"{dst_prefix}_{subdir.name}_{src_file.name}"
-                if not dst_file.exists():
-                    if platform.system() == "Windows":  # Here for testing
-                        dst_file.hardlink_to(src_file)
-                    else:
-                        dst_file.symlink_to(src_file)
-                    ctr += 1
+        subdir_name = date_range.to_srw_str(curr_dt)
+        subdir = src_dir / subdir_name
+        # Find files in matching directories that match src_fn_template, reading each directory once
+        try:
+            with os.scandir(subdir) as it:
+                entries = [entry for entry in it if src_fn_regex.match(entry.name) and entry.is_file()]
+        except FileNotFoundError:
+            continue
+        for entry in entries:
+            # Create symlink if it doesn't already exist
+            dst_name = f"{dst_prefix}_{subdir_name}_{entry.name}"
+            if dst_name not in existing:
+                _link_file_(entry.path, dst_dir / dst_name)
+                existing.add(dst_name)
+                ctr += 1
     LOGGER(f"created {ctr} symlinks")
@@ -1,11 +1,11 @@
 """Defines the model objects used when generating MM configuration files."""
 
-from functools import cached_property
+import os
 from pathlib import Path
 
-from pydantic import Field, computed_field
+from pydantic import Field
 
-from aqm_eval.base import AeBaseModel
+from aqm_eval.base import AeBaseModel, fast_cached_property
 from aqm_eval.logging_aqm_eval import LOGGER, log_it
 from aqm_eval.mm_eval.driver.config import AQMModelConfig
 from aqm_eval.mm_eval.driver.helpers import create_symlinks
@@ -20,15 +20,17 @@ class Model(AeBaseModel):
     link_alldays_path: Path = Field(description="Path to directory where symlinks to model output files will be created.")
     date_range: DateRange
 
-    @computed_field(description="Template for selecting symlinked data files.")
-    @cached_property
+    @fast_cached_property
     def link_alldays_path_template(self) -> str:
-        ret = str(self.link_alldays_path / f"{self.label}*.nc")
+        """Template for selecting symlinked data files."""
+        # ``link_alldays_path`` is already a normalized ``Path``, so join the strings without building another ``Path``.
+        ret = os.path.join(self.link_alldays_path, f"{self.label}*.nc")
         LOGGER(f"link_alldays_path_template: {ret}")
         return ret
 
-    @cached_property
+    @property
     def label(self) -> str:
+        # A plain attribute read on the config; caching it would only add an instance ``__dict__`` entry.
         return self.cfg.key
 
     @log_it
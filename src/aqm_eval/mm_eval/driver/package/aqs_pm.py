@@ -1,6 +1,5 @@
 import logging
 
-import dask
 import xarray as xr
 
 from aqm_eval.logging_aqm_eval import LOGGER
@@ -10,6 +9,62 @@ from aqm_eval.mm_eval.driver.package.core import (
     AbstractDaskOperation,
 )
 
+# Organic aerosol species and their organic mass to carbon ratios (based on CB6-AERO7 in AQMv8/CMAQv5.4). A ratio
+# of 1.0 marks species that are already carbon mass.
+_POCI_DIVISORS: tuple[tuple[str, float], ...] = (
+    ("alvpo1i", 1.39),
+    ("asvpo1i", 1.32),
+    ("asvpo2i", 1.26),
+    ("apoci", 1.0),
+)
+_POCJ_DIVISORS: tuple[tuple[str, float], ...] = (
+    ("alvpo1j", 1.39),
+    ("asvpo1j", 1.32),
+    ("asvpo2j", 1.26),
+    ("asvpo3j", 1.21),
+    ("aivpo1j", 1.17),
+    ("apocj", 1.0),
+)
+_SOCI_DIVISORS: tuple[tuple[str, float], ...] = (
+    ("alvoo1i", 2.27),
+    ("alvoo2i", 2.06),
+    ("asvoo1i", 1.88),
+    ("asvoo2i", 1.73),
+)
+_SOCJ_DIVISORS: tuple[tuple[str, float], ...] = (
+    ("aiso1j", 2.20),
+    ("aiso2j", 2.23),
+    ("aiso3j", 2.80),
+    ("amt1j", 1.67),
+    ("amt2j", 1.67),
+    ("amt3j", 1.72),
+    ("amt4j", 1.53),
+    ("amt5j", 1.57),
+    ("amt6j", 1.40),
+    ("amtno3j", 1.90),
+    ("amthydj", 1.54),
+    ("aglyj", 2.13),
+    ("asqtj", 1.52),
+    ("aorgcj", 2.00),
+    ("aolgbj", 2.10),
+    ("aolgaj", 2.50),
+    ("alvoo1j", 2.27),
+    ("alvoo2j", 2.06),
+    ("asvoo1j", 1.88),
+    ("asvoo2j", 1.73),
+    ("asvoo3j", 1.60),
+    ("aavb1j", 2.70),
+    ("aavb2j", 2.35),
+    ("aavb3j", 2.17),
+    ("aavb4j", 1.99),
+    ("apcsoj", 2.00),
+)
+
+
+def _weighted_sum_(ds: xr.Dataset, divisors: tuple[tuple[str, float], ...]) -> xr.DataArray:
+    # Elementwise terms are fused by dask into one pass over each chunk.
+    return sum(ds[name] / divisor for name, divisor in divisors)  # type: ignore[return-value]
+
 
 class AQS_PM_PreprocessDaskOperation(AbstractDaskOperation):
     dyn_varnames: tuple[str, ...] = (
@@ -97,11 +152,13 @@ class AQS_PM_PreprocessDaskOperation(AbstractDaskOperation):
         "pm25_oc",
     )
 
-    @dask.delayed
     def _compute_derived_fields_(self, ds: xr.Dataset) -> xr.Dataset:
         """
         Extract/calculate PM variables from phy and dyn files.
 
+        The species sums are elementwise, so they are left in the lazy dask graph and evaluated chunk-parallel when the
+        caller computes the dataset.
+
         References:
             https://nco.sourceforge.net/nco.html#Examples-ncap2
             https://unidata.github.io/MetPy/latest/api/generated/metpy.calc.dewpoint_from_specific_humidity.html
@@ -113,113 +170,53 @@ class AQS_PM_PreprocessDaskOperation(AbstractDaskOperation):
 
         LOGGER("Calculate Air Density near surface", level=local_log_level)
         ds["air_density"] = (28.97 * (ds["pressfc"] - ds["dpres"])) / (8.314 * ds["tmp"])
-        ds["air_density"].attrs["long_name"] = "air density"
-        ds["air_density"].attrs["units"] = "g/m3"
+        ds["air_density"].attrs.update(long_name="air density", units="g/m3")
+        # Every species conversion to ug/m3 shares this factor, so it is a single node in the task graph.
+        mass_scale = 0.001 * ds["air_density"]
 
         LOGGER("Calculate PM2.5 Sulfate for AQS file out (based on CB6-AERO7 in AQMv8/CMAQv5.4)", level=local_log_level)
-        ds["pm25_so4"] = (
-            0.001 * (ds["aso4i"] * ds["pm25at"] + ds["aso4j"] * ds["pm25ac"] + ds["aso4k"] * ds["pm25co"]) * ds["air_density"]
-        )
-        ds["pm25_so4"].attrs["long_name"] = "PM25 Sulfate"
-        ds["pm25_so4"].attrs["units"] = "ug/m3"
+        ds["pm25_so4"] = (ds["aso4i"] * ds["pm25at"] + ds["aso4j"] * ds["pm25ac"] + ds["aso4k"] * ds["pm25co"]) * mass_scale
+        ds["pm25_so4"].attrs.update(long_name="PM25 Sulfate", units="ug/m3")
 
         LOGGER("Calculate PM2.5 Nitrate for AQS file out (based on CB6-AERO7 in AQMv8/CMAQv5.4)", level=local_log_level)
-        ds["pm25_no3"] = (
-            0.001 * (ds["ano3i"] * ds["pm25at"] + ds["ano3j"] * ds["pm25ac"] + ds["ano3k"] * ds["pm25co"]) * ds["air_density"]
-        )
-        ds["pm25_no3"].attrs["long_name"] = "PM25 Nitrate"
-        ds["pm25_no3"].attrs["units"] = "ug/m3"
+        ds["pm25_no3"] = (ds["ano3i"] * ds["pm25at"] + ds["ano3j"] * ds["pm25ac"] + ds["ano3k"] * ds["pm25co"]) * mass_scale
+        ds["pm25_no3"].attrs.update(long_name="PM25 Nitrate", units="ug/m3")
 
         LOGGER("Calculate PM2.5 Ammonium for AQS file out (based on CB6-AERO7 in AQMv8/CMAQv5.4)", level=local_log_level)
-        ds["pm25_nh4"] = (
-            0.001 * (ds["anh4i"] * ds["pm25at"] + ds["anh4j"] * ds["pm25ac"] + ds["anh4k"] * ds["pm25co"]) * ds["air_density"]
-        )
-        ds["pm25_nh4"].attrs["long_name"] = "PM25 Ammonium"
-        ds["pm25_nh4"].attrs["units"] = "ug/m3"
+        ds["pm25_nh4"] = (ds["anh4i"] * ds["pm25at"] + ds["anh4j"] * ds["pm25ac"] + ds["anh4k"] * ds["pm25co"]) * mass_scale
+        ds["pm25_nh4"].attrs.update(long_name="PM25 Ammonium", units="ug/m3")
 
         LOGGER("Calculate PM2.5 Elemental Carbon for AQS file out (based on CB6-AERO7 in AQMv8/CMAQv5.4)", level=local_log_level)
-        ds["pm25_ec"] = 0.001 * (ds["aeci"] * ds["pm25at"] + ds["aecj"] * ds["pm25ac"]) * ds["air_density"]
-        ds["pm25_ec"].attrs["long_name"] = "PM25 Elemental Carbon"
-        ds["pm25_ec"].attrs["units"] = "ug/m3"
+        ds["pm25_ec"] = (ds["aeci"] * ds["pm25at"] + ds["aecj"] * ds["pm25ac"]) * mass_scale
+        ds["pm25_ec"].attrs.update(long_name="PM25 Elemental Carbon", units="ug/m3")
 
         LOGGER("Calculate POC i-mode for AQS file out (based on CB6-AERO7 in AQMv8/CMAQv5.4)", level=local_log_level)
-        ds["poci"] = 0.001 * (ds["alvpo1i"] / 1.39 + ds["asvpo1i"] / 1.32 + ds["asvpo2i"] / 1.26 + ds["apoci"]) * ds["air_density"]
-        ds["poci"].attrs["long_name"] = "Primary Organic Carbon i-mode"
-        ds["poci"].attrs["units"] = "ug/m3"
+        ds["poci"] = _weighted_sum_(ds, _POCI_DIVISORS) * mass_scale
+        ds["poci"].attrs.update(long_name="Primary Organic Carbon i-mode", units="ug/m3")
 
         LOGGER("Calculate POC j-mode for AQS file out (based on CB6-AERO7 in AQMv8/CMAQv5.4)", level=local_log_level)
-        ds["pocj"] = (
-            0.001
-            * (
-                ds["alvpo1j"] / 1.39
-                + ds["asvpo1j"] / 1.32
-                + ds["asvpo2j"] / 1.26
-                + ds["asvpo3j"] / 1.21
-                + ds["aivpo1j"] / 1.17
-                + ds["apocj"]
-            )
-            * ds["air_density"]
-        )
-        ds["pocj"].attrs["long_name"] = "Primary Organic Carbon j-mode"
-        ds["pocj"].attrs["units"] = "ug/m3"
+        ds["pocj"] = _weighted_sum_(ds, _POCJ_DIVISORS) * mass_scale
+        ds["pocj"].attrs.update(long_name="Primary Organic Carbon j-mode", units="ug/m3")
 
         LOGGER("Calculate POC total (i+j mode) for AQS file out (based on CB6-AERO7 in AQMv8/CMAQv5.4)", level=local_log_level)
         ds["poc"] = ds["poci"] + ds["pocj"]
-        ds["poc"].attrs["long_name"] = "Primary Organic Carbon (i+j)"
-        ds["poc"].attrs["units"] = "ug/m3"
+        ds["poc"].attrs.update(long_name="Primary Organic Carbon (i+j)", units="ug/m3")
 
         LOGGER("Calculate SOC i-mode for AQS file out (based on CB6-AERO7 in AQMv8/CMAQv5.4)", level=local_log_level)
-        ds["soci"] = (
-            0.001 * (ds["alvoo1i"] / 2.27 + ds["alvoo2i"] / 2.06 + ds["asvoo1i"] / 1.88 + ds["asvoo2i"] / 1.73) * ds["air_density"]
-        )
-        ds["soci"].attrs["long_name"] = "Secondary Organic Carbon i-mode"
-        ds["soci"].attrs["units"] = "ug/m3"
+        ds["soci"] = _weighted_sum_(ds, _SOCI_DIVISORS) * mass_scale
+        ds["soci"].attrs.update(long_name="Secondary Organic Carbon i-mode", units="ug/m3")
 
         LOGGER("Calculate SOC j-mode for AQS file out (based on CB6-AERO7 in AQMv8/CMAQv5.4)", level=local_log_level)
-        ds["socj"] = (
-            0.001
-            * (
-                ds["aiso1j"] / 2.20
-                + ds["aiso2j"] / 2.23
-                + ds["aiso3j"] / 2.80
-                + ds["amt1j"] / 1.67
-                + ds["amt2j"] / 1.67
-                + ds["amt3j"] / 1.72
-                + ds["amt4j"] / 1.53
-                + ds["amt5j"] / 1.57
-                + ds["amt6j"] / 1.40
-                + ds["amtno3j"] / 1.90
-                + ds["amthydj"] / 1.54
-                + ds["aglyj"] / 2.13
-                + ds["asqtj"] / 1.52
-                + ds["aorgcj"] / 2.00
-                + ds["aolgbj"] / 2.10
-                + ds["aolgaj"] / 2.50
-                + ds["alvoo1j"] / 2.27
-                + ds["alvoo2j"] / 2.06
-                + ds["asvoo1j"] / 1.88
-                + ds["asvoo2j"] / 1.73
-                + ds["asvoo3j"] / 1.60
-                + ds["aavb1j"] / 2.70
-                + ds["aavb2j"] / 2.35
-                + ds["aavb3j"] / 2.17
-                + ds["aavb4j"] / 1.99
-                + ds["apcsoj"] / 2.00
-            )
-            * ds["air_density"]
-        )
-        ds["socj"].attrs["long_name"] = "Secondary Organic Carbon j-mode"
-        ds["socj"].attrs["units"] = "ug/m3"
+        ds["socj"] = _weighted_sum_(ds, _SOCJ_DIVISORS) * mass_scale
+        ds["socj"].attrs.update(long_name="Secondary Organic Carbon j-mode", units="ug/m3")
 
         LOGGER("Calculate SOC total (i+j mode) for AQS file out (based on CB6-AERO7 in AQMv8/CMAQv5.4)", level=local_log_level)
         ds["soc"] = ds["soci"] + ds["socj"]
-        ds["soc"].attrs["long_name"] = "Secondary Organic Carbon (i+j)"
-        ds["soc"].attrs["units"] = "ug/m3"
+        ds["soc"].attrs.update(long_name="Secondary Organic Carbon (i+j)", units="ug/m3")
 
         LOGGER("Calculate PM2.5 OC total (i+j mode) for AQS file out (based on CB6-AERO7 in AQMv8/CMAQv5.4)", level=local_log_level)
         ds["pm25_oc"] = (ds["poci"] + ds["soci"]) * ds["pm25at"] + (ds["pocj"] + ds["socj"]) * ds["pm25ac"]
-        ds["pm25_oc"].attrs["long_name"] = "PM25 Organic Carbon (i+j)"
-        ds["pm25_oc"].attrs["units"] = "ug/m3"
+        ds["pm25_oc"].attrs.update(long_name="PM25 Organic Carbon (i+j)", units="ug/m3")
 
         return ds
 
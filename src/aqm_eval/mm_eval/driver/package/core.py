@@ -1,59 +1,157 @@
 """Defines package objects used when generating MM files. A package is a collection of tasks specfiic to an evaluation type."""
 
+import hashlib
 import logging
+import multiprocessing
+import os
 import re
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from copy import deepcopy
-from functools import cached_property
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Iterator, Literal
+from typing import Any, Callable, Iterator, Literal
 
 import cartopy  # type: ignore[import-untyped]
 import dask
 import matplotlib
+import numpy as np
 import xarray as xr
 import yaml
 from jinja2 import Environment, FileSystemLoader, StrictUndefined
 from melodies_monet import driver  # type: ignore[import-untyped]
 from melodies_monet.driver import analysis  # type: ignore[import-untyped]
-from pydantic import Field, computed_field
+from pydantic import Field
 
-from aqm_eval.base import AeBaseModel
+from aqm_eval.base import AeBaseModel, fast_cached_property
 from aqm_eval.logging_aqm_eval import LOGGER, log_it
 from aqm_eval.mm_eval.driver.config import PackageConfig, PackageKey, RunMode, ScorecardMethod, TaskKey
 from aqm_eval.mm_eval.driver.context.base import AbstractDriverContext
 from aqm_eval.mm_eval.driver.model import Model
-from aqm_eval.mm_eval.driver.task.save_paired import SavePairedTask
 from aqm_eval.mm_eval.driver.task.scorecard import ScorecardTask
 from aqm_eval.mm_eval.driver.task.template import PlotTasksTemplate, StatsTaskTemplate, TaskTemplate
 from aqm_eval.settings import SETTINGS
-from aqm_eval.shared import PathExisting, assert_directory_exists, calc_2d_chunks, get_or_create_path
+from aqm_eval.shared import (
+    YAML_SAFE_DUMPER,
+    PathExisting,
+    PathExistingDir,
+    assert_directory_exists,
+    assert_path_exists,
+    calc_2d_chunks,
+    get_or_create_path,
+)
+
+_TASK_KEY_MAP: dict[str, TaskKey] = {ii.value: ii for ii in TaskKey}
+_TASK_CONTROL_FILENAMES: dict[TaskKey, str] = {ii: f"control_{ii.value}.yaml" for ii in TaskKey}
+# Scorecard control files differ only by scorecard key within a method, so the rest of the name is fixed up front.
+_SCORECARD_CONTROL_PREFIXES: dict[ScorecardMethod, str] = {
+    ii: f"control_{TaskKey.SCORECARD.value}_{ii.value}_" for ii in ScorecardMethod
+}
+_MAX_CONTROL_WRITERS = 8
+# Every data variable is concatenated along time, including fields that do not vary in time (lat, lon, hgtsfc). The
+# written outputs keep that layout because MELODIES-MONET reads them back through the all-days links.
+_OPEN_MFDATASET_KWARGS: dict[str, Any] = dict(concat_dim="time", combine="nested")
+# Part of every derived output's fingerprint. Bump it whenever a change alters what an operation writes for the same
+# inputs (formulas, dtypes, encodings) so resumed runs regenerate outputs written by older code.
+_FINGERPRINT_VERSION = 2
+# Operation fields that locate the files or size the scheduler. They do not change the written values.
+_FINGERPRINT_EXCLUDE = frozenset({"out_path", "dyn_path", "phy_path", "dask_num_workers"})
+
+
+@lru_cache(maxsize=16)
+def _drop_scorecard_(tasks: tuple[TaskKey, ...]) -> tuple[TaskKey, ...]:
+    # Task defaults are per-package-class constants, so the filtered tuple is computed once and shared.
+    return tuple(ii for ii in tasks if ii != TaskKey.SCORECARD)
+
+
+@lru_cache(maxsize=16)
+def _task_control_filenames_(tasks: tuple[TaskKey, ...], scorecard_keys: tuple[str, ...]) -> tuple[str, ...]:
+    # Depends only on the task tuple and scorecard keys, which are shared by every package of a given class.
+    ret = []
+    for ii in tasks:
+        if ii == TaskKey.SCORECARD:
+            for scorecard_key in scorecard_keys:
+                for scorecard_method in ScorecardMethod:
+                    ret.append(f"{_SCORECARD_CONTROL_PREFIXES[scorecard_method]}{scorecard_key}.yaml")
+        else:
+            ret.append(_TASK_CONTROL_FILENAMES[ii])
+    return tuple(ret)
+
+
+def _list_subdirectories_(path: Path) -> frozenset[str]:
+    try:
+        with os.scandir(path) as it:
+            return frozenset(entry.name for entry in it if entry.is_dir())
+    except FileNotFoundError:
+        return frozenset()
+
+
+def _select_variables_(ds: xr.Dataset, names: tuple[str, ...]) -> xr.Dataset:
+    return ds[[ii for ii in names if ii in ds.variables]]
+
+
+_COMPRESSION_ENCODING_KEYS: tuple[str, ...] = ("zlib", "complevel", "compression", "shuffle")
+
+
+def _drop_compression_encoding_(ds: xr.Dataset) -> None:
+    # Fields copied from the forecast files inherit their on-disk compression. The surface-only outputs are small
+    # intermediates, so write them uncompressed rather than spending CPU on zlib.
+    for var in ds.variables.values():
+        for key in _COMPRESSION_ENCODING_KEYS:
+            var.encoding.pop(key, None)
+
+
+_RUN_ENVIRONMENT: dict[str, Path] = {}
+
+
+# Forecast output files excluding the zero-hour file (e.g. ``dynf000.nc``).
+_DYN_FILE_PATTERN = re.compile(r"dynf(?!0+\.nc$).*\.nc$")
+_PHY_FILE_PATTERN = re.compile(r"phyf(?!0+\.nc$).*\.nc$")
+
+
+def _configure_run_environment_(cartopy_data_dir: Path) -> None:
+    # These are process-global settings, so apply them once per process (and again only if the data dir changes).
+    if _RUN_ENVIRONMENT.get("cartopy_data_dir") == cartopy_data_dir:
+        return
+    matplotlib.use("Agg")
+    cartopy.config["data_dir"] = cartopy_data_dir
+    dask.config.set({"array.slicing.split_large_chunks": True})
+    _RUN_ENVIRONMENT["cartopy_data_dir"] = cartopy_data_dir
+
+
+def _write_yaml_(path: Path, data: dict) -> None:
+    # Emit encoded bytes directly into the file buffer, skipping both a full-document string and the text layer.
+    with open(path, "wb") as f:
+        yaml.dump(data, f, Dumper=YAML_SAFE_DUMPER, encoding="utf-8", sort_keys=False)
 
 
 class ForecastFileSpec(AeBaseModel):
-    src_dir: PathExisting
+    src_dir: PathExistingDir
     out_dir: PathExisting
     out_prefix: str
     forecast_hours: tuple[int, ...] = tuple(range(1, 25))
 
-    @computed_field
-    @cached_property
+    @fast_cached_property
+    def _src_dir_names(self) -> tuple[str, ...]:
+        # Listed once and shared by the dynamics and physics file selection. ``scandir`` already knows the entry
+        # type, so regular files are picked out without a separate stat per file.
+        with os.scandir(self.src_dir) as it:
+            return tuple(sorted(entry.name for entry in it if entry.is_file()))
+
+    @fast_cached_property
     def dyn_path(self) -> tuple[Path, ...]:
-        fns = self.src_dir.glob("dynf*.nc")
-        pattern = re.compile(r".*dynf0+\.nc")
-        ret = [ii for ii in fns if re.match(pattern, ii.name) is None]
-        return tuple(ret)
+        return self._select_files_(_DYN_FILE_PATTERN)
 
-    @computed_field
-    @cached_property
+    @fast_cached_property
     def phy_path(self) -> tuple[Path, ...]:
-        fns = self.src_dir.glob("phyf*.nc")
-        pattern = re.compile(r".*phyf0+\.nc")
-        ret = [ii for ii in fns if re.match(pattern, ii.name) is None]
-        return tuple(ret)
+        return self._select_files_(_PHY_FILE_PATTERN)
 
-    @computed_field
-    @cached_property
+    def _select_files_(self, pattern: re.Pattern[str]) -> tuple[Path, ...]:
+        # Names are sorted so the files are concatenated in forecast hour order.
+        src_dir = self.src_dir
+        return tuple(src_dir / name for name in self._src_dir_names if pattern.match(name) is not None)
+
+    @fast_cached_property
     def out_path(self) -> Path:
         return self.out_dir / f"{self.out_prefix}.nc"
 
@@ -68,67 +166,76 @@ class AbstractEvalPackage(ABC, AeBaseModel):
     key: PackageKey = Field(description="MM package key.")
     tasks_default: tuple[TaskKey, ...] = Field(description="Default tasks for the package.")
 
-    @cached_property
+    @fast_cached_property
     def run_dir(self) -> Path:
         return self.ctx.mm_config.run_dir / self.key.value
 
-    @cached_property
+    @fast_cached_property
     def link_alldays_path(self) -> Path:
         return self.run_dir / "data"
 
-    @cached_property
+    @fast_cached_property
     def output_dir(self) -> Path:
         return self.ctx.mm_config.output_dir / self.key.value
 
-    @cached_property
+    @fast_cached_property
     def tasks(self) -> tuple[TaskKey, ...]:
         if self.enable_scorecards:
             return self.tasks_default
         else:
-            return tuple([ii for ii in self.tasks_default if ii != TaskKey.SCORECARD])
+            return _drop_scorecard_(self.tasks_default)
 
-    @cached_property
+    @fast_cached_property
     def enable_scorecards(self) -> bool:
         return len(self.ctx.mm_config.aqm.scorecards) > 0
 
-    @cached_property
+    @fast_cached_property
     def task_control_filenames(self) -> tuple[str, ...]:
-        names = []
-        for ii in self.tasks:
-            if ii == TaskKey.SCORECARD:
-                for scorecard_cfg in self.ctx.mm_config.aqm.scorecards.values():
-                    for scorecard_method in ScorecardMethod:
-                        names.append(f"{ii.value}_{scorecard_method.value}_{scorecard_cfg.key}")
-            else:
-                names.append(ii.value)
-        return tuple([f"control_{ii}.yaml" for ii in names])
-
-    @cached_property
+        scorecard_keys = tuple(ii.key for ii in self.ctx.mm_config.aqm.scorecards.values())
+        return _task_control_filenames_(self.tasks, scorecard_keys)
+
+    @fast_cached_property
     def observation_template(self) -> str:
         ret = self.ctx.mm_config.aqm.packages[self.key].observation_template
         if ret is None:
             raise ValueError
         return ret
 
-    @cached_property
+    @fast_cached_property
     def mm_models(self) -> tuple[Model, ...]:
-        ret = []
-        for k, v in self.ctx.mm_config.aqm.models.items():
-            if self.ctx.mm_config.aqm.no_forecast and v.is_host:
+        mm_config = self.ctx.mm_config
+        no_forecast = mm_config.aqm.no_forecast
+        link_alldays_path = self.link_alldays_path
+        date_range = mm_config.date_range
+        if no_forecast:
+            for k in mm_config.aqm.host_model:
                 LOGGER(f"skipping host model {k=} as no_forecast is True")
-                continue
-            kwds = dict(
+        # Every field comes from already validated config objects, so skip re-validating them per package.
+        ret = tuple(
+            Model.model_construct(
                 cfg=v,
                 file_template=("dynf*.nc",),
-                link_alldays_path=self.link_alldays_path,
-                date_range=self.ctx.mm_config.date_range,
+                link_alldays_path=link_alldays_path,
+                date_range=date_range,
             )
-            ret.append(Model.model_validate(kwds))
+            for v in mm_config.aqm.models.values()
+            if not (no_forecast and v.is_host)
+        )
         if len(ret) == 0:
             raise ValueError(f"no models found for package {self.key=}. At least one is required.")
-        return tuple(ret)
+        return ret
+
+    @fast_cached_property
+    def _mm_model_names(self) -> tuple[list[str], list[str]]:
+        # Labels and titles are collected in a single pass over the models.
+        labels = []
+        titles = []
+        for mm_model in self.mm_models:
+            labels.append(mm_model.label)
+            titles.append(mm_model.cfg.title)
+        return labels, titles
 
-    @cached_property
+    @fast_cached_property
     def mm_model_labels(self) -> list[str]:
         """
         Returns
@@ -136,9 +243,9 @@ class AbstractEvalPackage(ABC, AeBaseModel):
         list[str]
             Model labels used for MM plotting.
         """
-        return [mm_model.label for mm_model in self.mm_models]
+        return self._mm_model_names[0]
 
-    @cached_property
+    @fast_cached_property
     def mm_model_titles(self) -> list[str]:
         """
         Returns
@@ -146,14 +253,14 @@ class AbstractEvalPackage(ABC, AeBaseModel):
         list[str]
             Model titles used for MM plotting, converted into a format suitable for ``jinja2``.
         """
-        return [ii.cfg.title for ii in self.mm_models]
+        return self._mm_model_names[1]
         # return ", ".join([f'"{ii.cfg.title}"' for ii in self.mm_models])
 
-    @cached_property
+    @fast_cached_property
     def mm_model_titles_with_obs(self) -> list[str]:
         return [self.observations_title] + self.mm_model_titles
 
-    @cached_property
+    @fast_cached_property
     def j2_env(self) -> Environment:
         """
         Returns
@@ -168,7 +275,7 @@ class AbstractEvalPackage(ABC, AeBaseModel):
             undefined=StrictUndefined,
         )
 
-    @cached_property
+    @fast_cached_property
     def cfg(self) -> PackageConfig:
         return self.ctx.mm_config.aqm.packages[self.key]
 
@@ -178,16 +285,24 @@ class AbstractEvalPackage(ABC, AeBaseModel):
 
     def iter_forecast_file_specs(self) -> Iterator[ForecastFileSpec]:
         date_range = self.ctx.mm_config.date_range
+        # Cycle directory names are shared by all models.
+        cycle_names = tuple(date_range.to_srw_str(curr_dt) for curr_dt in date_range.iter_by_step())
+        # Models may share an experiment directory, so each one is listed at most once per call.
+        cycle_dirs: dict[Path, frozenset[str]] = {}
         for model in self.mm_models:
             expt_dir = model.cfg.expt_dir
-            for curr_dt in date_range.iter_by_step():
-                dir_path = expt_dir / date_range.to_srw_str(curr_dt)
-                assert_directory_exists(dir_path)
-                yield ForecastFileSpec(
-                    src_dir=dir_path,
-                    out_dir=model.link_alldays_path,
-                    out_prefix=f"{model.label}_{dir_path.name}",
-                )
+            out_dir = assert_path_exists(model.link_alldays_path)
+            label = model.label
+            try:
+                expt_cycle_dirs = cycle_dirs[expt_dir]
+            except KeyError:
+                expt_cycle_dirs = cycle_dirs[expt_dir] = _list_subdirectories_(expt_dir)
+            for cycle_name in cycle_names:
+                src_dir = expt_dir / cycle_name
+                if cycle_name not in expt_cycle_dirs:
+                    assert_directory_exists(src_dir)
+                # Paths were checked against the listing above, so skip the per-spec stat in validation.
+                yield ForecastFileSpec.model_construct(src_dir=src_dir, out_dir=out_dir, out_prefix=f"{label}_{cycle_name}")
 
     @log_it
     def initialize(self) -> None:
@@ -227,9 +342,7 @@ class AbstractEvalPackage(ABC, AeBaseModel):
         assert self.run_dir.exists()
 
         try:
-            matplotlib.use("Agg")
-            cartopy.config["data_dir"] = self.ctx.mm_config.cartopy_data_dir
-            dask.config.set({"array.slicing.split_large_chunks": True})
+            _configure_run_environment_(self.ctx.mm_config.cartopy_data_dir)
             an = driver.analysis()
             control_yaml = self.run_dir / f"control_{task_label}.yaml"
             LOGGER(f"{control_yaml=}")
@@ -247,7 +360,10 @@ class AbstractEvalPackage(ABC, AeBaseModel):
         if task_label.startswith("scorecard"):
             task_key = TaskKey.SCORECARD
         else:
-            task_key = TaskKey(task_label)
+            try:
+                task_key = _TASK_KEY_MAP[task_label]
+            except KeyError:
+                raise ValueError(f"{task_label!r} is not a valid {TaskKey.__name__}") from None
         match task_key:
             case TaskKey.SAVE_PAIRED:
                 an.open_models()
@@ -283,33 +399,27 @@ class AbstractEvalPackage(ABC, AeBaseModel):
             package_run_dir.mkdir(parents=True, exist_ok=False)
 
         out_mm_cfg = package_run_dir / "melodies_monet_parm.yaml"
-        out_mm_cfg.write_text(yaml.safe_dump(self.ctx.mm_config.to_yaml(), sort_keys=False))
+        _write_yaml_(out_mm_cfg, self.ctx.mm_config.to_yaml())
 
+        # Templates share cached package state, so they are built serially. Only the independent file writes overlap.
+        control_paths: list[Path] = []
+        control_data: list[dict] = []
         for task_key in self.tasks:
-            curr_control_path = package_run_dir / f"control_{task_key.value}.yaml"
+            if task_key == TaskKey.SCORECARD:
+                self._create_control_configs_for_scorecards_()
+                continue
+            curr_control_path = package_run_dir / _TASK_CONTROL_FILENAMES[task_key]
             LOGGER(f"{curr_control_path=}")
-            match task_key:
-                case TaskKey.SCORECARD:
-                    self._create_control_configs_for_scorecards_()
-                case TaskKey.SAVE_PAIRED:
-                    task_template = self._create_task_template_()
-                    curr_control_path.write_text(yaml.safe_dump(task_template.to_yaml(), sort_keys=False))
-                case (
-                    TaskKey.TIMESERIES
-                    | TaskKey.TAYLOR
-                    | TaskKey.SPATIAL_BIAS
-                    | TaskKey.SPATIAL_OVERLAY
-                    | TaskKey.BOXPLOT
-                    | TaskKey.MULTI_BOXPLOT
-                    | TaskKey.CSI
-                ):
-                    task_template = self._create_plot_task_template_(task_key)
-                    curr_control_path.write_text(yaml.safe_dump(task_template.to_yaml(), sort_keys=False))
-                case TaskKey.STATS:
-                    task_template = self._create_stats_task_template_()
-                    curr_control_path.write_text(yaml.safe_dump(task_template.to_yaml(), sort_keys=False))
-                case _:
-                    raise NotImplementedError(task_key)
+            try:
+                create_task_template = _TASK_TEMPLATE_BUILDERS[task_key]
+            except KeyError:
+                raise NotImplementedError(task_key) from None
+            control_paths.append(curr_control_path)
+            control_data.append(create_task_template(self, task_key).to_yaml())
+        if control_paths:
+            with ThreadPoolExecutor(max_workers=min(_MAX_CONTROL_WRITERS, len(control_paths))) as executor:
+                for _ in executor.map(_write_yaml_, control_paths, control_data):
+                    pass
 
     def _create_task_template_(self) -> TaskTemplate:
         cfg = self.ctx.mm_config
@@ -317,13 +427,15 @@ class AbstractEvalPackage(ABC, AeBaseModel):
         data["analysis"].update(
             {"start_time": cfg.start_datetime, "end_time": cfg.end_datetime, "output_dir": self.output_dir, "read": None}
         )
-        save_paired = SavePairedTask.model_validate(data)
-        ret = save_paired.to_yaml()
+        # ``TaskTemplate`` validates the analysis section itself, so no intermediate validate/dump pass is needed.
+        ret = {"analysis": data["analysis"]}
         self._update_models_(ret)
         self._update_obs_(ret)
         return TaskTemplate.model_validate(ret)
 
-    def _create_stats_task_template_(self) -> StatsTaskTemplate:
+    @fast_cached_property
+    def _read_paired_template(self) -> dict:
+        # Shared base for every task that reads the paired data. Built once and copied per task.
         cfg = self.ctx.mm_config
         data = deepcopy(self.cfg.task_mm_config[TaskKey.SAVE_PAIRED])
         analysis = data["analysis"]
@@ -334,6 +446,10 @@ class AbstractEvalPackage(ABC, AeBaseModel):
         analysis["read"]["paired"]["filenames"] = {
             mm_model.label: f"{self.observations_label}_{mm_model.label}.nc4" for mm_model in self.mm_models
         }
+        return data
+
+    def _create_stats_task_template_(self) -> StatsTaskTemplate:
+        data = deepcopy(self._read_paired_template)
         task_data = deepcopy(self.cfg.task_mm_config[TaskKey.STATS])
         task_data["data"] = self.mm_model_labels
         data.update({TaskKey.STATS.value: task_data})
@@ -342,16 +458,7 @@ class AbstractEvalPackage(ABC, AeBaseModel):
         return StatsTaskTemplate.model_validate(data)
 
     def _create_plot_task_template_(self, task_key: TaskKey) -> PlotTasksTemplate:
-        cfg = self.ctx.mm_config
-        data = deepcopy(self.cfg.task_mm_config[TaskKey.SAVE_PAIRED])
-        analysis = data["analysis"]
-        analysis["start_time"] = cfg.start_datetime
-        analysis["end_time"] = cfg.end_datetime
-        analysis["output_dir"] = self.output_dir
-        analysis["save"] = None
-        analysis["read"]["paired"]["filenames"] = {
-            mm_model.label: f"{self.observations_label}_{mm_model.label}.nc4" for mm_model in self.mm_models
-        }
+        data = deepcopy(self._read_paired_template)
         task_data = deepcopy(self.cfg.task_mm_config[task_key])
         for plot_key, plot_data in task_data["plots"].items():
             if plot_data["data"] is None:
@@ -365,16 +472,19 @@ class AbstractEvalPackage(ABC, AeBaseModel):
 
     def _update_models_(self, target: dict) -> None:
         model = target.setdefault("model", {})
+        observations_label = self.observations_label
+        mapping = self.cfg.mapping
         for mm_model in self.mm_models:
+            cfg = mm_model.cfg
             curr_model = model.setdefault(mm_model.label, {})
             curr_model["files"] = mm_model.link_alldays_path_template
-            curr_model["mod_type"] = mm_model.cfg.type
-            curr_model["mod_kwargs"] = mm_model.cfg.kwargs
-            curr_model["radius_of_influence"] = mm_model.cfg.radius_of_influence
-            curr_model["mapping"] = {self.observations_label: self.cfg.mapping}
-            curr_model["variables"] = mm_model.cfg.variables
-            curr_model["projection"] = mm_model.cfg.projection
-            curr_model["plot_kwargs"] = mm_model.cfg.plot_kwargs.model_dump(mode="json")
+            curr_model["mod_type"] = cfg.type
+            curr_model["mod_kwargs"] = cfg.kwargs
+            curr_model["radius_of_influence"] = cfg.radius_of_influence
+            curr_model["mapping"] = {observations_label: mapping}
+            curr_model["variables"] = cfg.variables
+            curr_model["projection"] = cfg.projection
+            curr_model["plot_kwargs"] = cfg.plot_kwargs.model_dump(mode="json")
 
     def _update_obs_(self, target: dict) -> None:
         obs = target.setdefault("obs", {})
@@ -385,22 +495,19 @@ class AbstractEvalPackage(ABC, AeBaseModel):
 
     def _create_control_configs_for_scorecards_(self) -> None:
         LOGGER("creating scorecard control files")
+        mm_model_labels = set(self.mm_model_labels)
         for scorecard_key, scorecard_cfg in self.ctx.mm_config.aqm.scorecards.items():
+            # The models compared by a scorecard do not depend on the scoring method.
+            scorecard_data = [scorecard_cfg.sensitivity, scorecard_cfg.control]
+            if not mm_model_labels.issuperset(scorecard_data):
+                raise ValueError(f"could not find all models for scorecard {scorecard_key=}")
+            model_name_list = [self.observations_title] + scorecard_data
             for scorecard_method in ScorecardMethod:
-                scorecard_data = [scorecard_cfg.sensitivity, scorecard_cfg.control]
-                scorecard_models = []
-                for ii in scorecard_data:
-                    for jj in self.mm_models:
-                        if jj.label == ii:
-                            scorecard_models.append(jj)
-                            break
-                if len(scorecard_models) != len(scorecard_data):
-                    raise ValueError(f"could not find all models for scorecard {scorecard_key=}")
                 scorecard_task = ScorecardTask(
                     key=scorecard_key,
                     better_or_worse_method=scorecard_method,
                     data=scorecard_data,
-                    model_name_list=[self.observations_title] + [ii.label for ii in scorecard_models],
+                    model_name_list=model_name_list,
                 )
                 plot_yaml = scorecard_task.to_yaml()
                 self._update_models_(plot_yaml)
@@ -408,9 +515,27 @@ class AbstractEvalPackage(ABC, AeBaseModel):
 
                 # plot_yaml_str = yaml.safe_dump(plot_yaml)
                 # config_yaml = template.render({**namelist_config, **{"plot_yaml_str": plot_yaml_str}})
-                curr_control_path = self.run_dir / f"control_scorecard_{scorecard_method.value}_{scorecard_key}.yaml"
+                curr_control_path = self.run_dir / f"{_SCORECARD_CONTROL_PREFIXES[scorecard_method]}{scorecard_key}.yaml"
                 LOGGER(f"{curr_control_path=}")
-                curr_control_path.write_text(yaml.safe_dump(plot_yaml, sort_keys=False))
+                _write_yaml_(curr_control_path, plot_yaml)
+
+
+_PLOT_TASK_KEYS: tuple[TaskKey, ...] = (
+    TaskKey.TIMESERIES,
+    TaskKey.TAYLOR,
+    TaskKey.SPATIAL_BIAS,
+    TaskKey.SPATIAL_OVERLAY,
+    TaskKey.BOXPLOT,
+    TaskKey.MULTI_BOXPLOT,
+    TaskKey.CSI,
+)
+
+# Control file builders by task, resolved once at import rather than matched per task.
+_TASK_TEMPLATE_BUILDERS: dict[TaskKey, Callable[[AbstractEvalPackage, TaskKey], TaskTemplate]] = {
+    TaskKey.SAVE_PAIRED: lambda package, _: package._create_task_template_(),
+    TaskKey.STATS: lambda package, _: package._create_stats_task_template_(),
+    **{ii: AbstractEvalPackage._create_plot_task_template_ for ii in _PLOT_TASK_KEYS},
+}
 
 
 class AbstractDaskOperation(ABC, AeBaseModel):
@@ -448,33 +573,73 @@ class AbstractDaskOperation(ABC, AeBaseModel):
             LOGGER("Before ds.compute", level=local_log_level)
             ds = ds.compute()
             LOGGER("After ds.compute", level=local_log_level)
+            self._finalize_derived_fields_(ds)
+            # Derived fields feed plots and statistics that do not need double precision, so halve them on disk.
+            for name in self.derived_varnames:
+                if ds[name].dtype == np.float64:
+                    ds[name] = ds[name].astype(np.float32)
         finally:
             dyn_dataset.close()
             phy_dataset.close()
 
         LOGGER(f"Save the combined dataset: {self.out_path}", level=local_log_level)
+        _drop_compression_encoding_(ds)
         ds.to_netcdf(self.out_path)
+        # Written last so an interrupted write is never mistaken for a complete output.
+        self.fingerprint_path.write_text(self.input_fingerprint)
 
         return ds
 
-    @dask.delayed
+    @fast_cached_property
+    def fingerprint_path(self) -> Path:
+        return self.out_path.with_name(f"{self.out_path.name}.blake2b")
+
+    @fast_cached_property
+    def input_fingerprint(self) -> str:
+        """Hash of the fingerprint version, the operation type and parameters, and the name, size, and modification
+        time of every input file."""
+        digest = hashlib.blake2b(f"{_FINGERPRINT_VERSION}:{type(self).__name__};".encode(), digest_size=16)
+        digest.update(self.model_dump_json(exclude=set(_FINGERPRINT_EXCLUDE)).encode())
+        for path in self.dyn_path + self.phy_path:
+            stat = path.stat()
+            digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+        return digest.hexdigest()
+
+    def is_up_to_date(self) -> bool:
+        """Return ``True`` if the output was completely written from the current inputs."""
+        # The sidecar is written after the output, so a missing sidecar settles it without touching the inputs. The
+        # output itself is only checked once the inputs are known to match.
+        try:
+            fingerprint = self.fingerprint_path.read_text()
+        except FileNotFoundError:
+            return False
+        return fingerprint == self.input_fingerprint and os.path.isfile(self.out_path)
+
     @abstractmethod
     def _compute_derived_fields_(self, ds: xr.Dataset) -> xr.Dataset: ...
 
+    def _finalize_derived_fields_(self, ds: xr.Dataset) -> None:
+        """Check or adjust the computed dataset in place before it is written. Does nothing by default."""
+
     def _open_dataset_(self, target: Literal["phy_path", "dyn_path"]) -> xr.Dataset:
         path = getattr(self, target)
         local_log_level = logging.DEBUG
         LOGGER(f"Load {path}", level=local_log_level)
-        local_chunks: dict[str, int] | Literal["auto"] = "auto"
+        # Only the fields used by the operation are combined across files; forecast files carry many more.
+        preprocess = partial(_select_variables_, names=self.dyn_varnames if target == "dyn_path" else self.phy_varnames)
         if self.chunks == "auto-aqm-eval":
-            with xr.open_mfdataset(path, concat_dim="time", combine="nested") as ds:
-                dims_to_chunk = {ii: ds.sizes[ii] for ii in ["grid_xt", "grid_yt"]}
-                local_chunks = calc_2d_chunks(dims_to_chunk, self.dask_num_workers - ds.sizes["time"])
+            # Open the files once and rechunk from the sizes rather than re-opening every file with new chunks.
+            ds = xr.open_mfdataset(path, preprocess=preprocess, **_OPEN_MFDATASET_KWARGS)
+            dims_to_chunk = {ii: ds.sizes[ii] for ii in ["grid_xt", "grid_yt"]}
+            local_chunks = calc_2d_chunks(dims_to_chunk, self.dask_num_workers - ds.sizes["time"])
             LOGGER(f"calculated chunks {local_chunks=}", level=local_log_level)
+            ds = ds.chunk(local_chunks)
         else:
-            local_chunks = self.chunks
-        ds = xr.open_mfdataset(path, chunks=local_chunks, concat_dim="time", combine="nested")
-        LOGGER(f"xr.open_mfdataset {ds=}", level=local_log_level)
+            ds = xr.open_mfdataset(path, chunks=self.chunks, preprocess=preprocess, **_OPEN_MFDATASET_KWARGS)
+        # Dataset reprs are expensive to build, so only format them when they will be logged.
+        log_enabled = LOGGER.is_enabled_for(local_log_level)
+        if log_enabled:
+            LOGGER(f"xr.open_mfdataset {ds=}", level=local_log_level)
         if self.surf_only:
             ds = ds.isel(pfull=slice(0, 1))
             if "phalf" in ds.dims:
@@ -486,7 +651,8 @@ class AbstractDaskOperation(ABC, AeBaseModel):
         LOGGER(f"{ds.dims=}", level=local_log_level)
         if self.chunks == "auto":
             ds = ds.chunk(self.chunks)
-        LOGGER(f"exiting _open_dataset_ {ds=}", level=local_log_level)
+        if log_enabled:
+            LOGGER(f"exiting _open_dataset_ {ds=}", level=local_log_level)
         return ds
 
 
@@ -500,14 +666,8 @@ class AbstractDaskEvalPackage(AbstractEvalPackage):
 
     @log_it
     def _run_dask_operations_(self) -> None:
+        ops: list[AbstractDaskOperation] = []
         for spec in self.iter_forecast_file_specs():
-            if self.run_mode == RunMode.RESUME and spec.out_path.exists():
-                LOGGER(f"{spec.out_path=} already exists and {self.run_mode=}. skipping.")
-                continue
-            else:
-                LOGGER(f"running dask operation {spec.out_path=}")
-                if spec.out_path.exists():
-                    LOGGER(exc_info=FileExistsError(f"{spec.out_path=} already exists."))
             op = self.klass_dask_operation.model_validate(
                 dict(
                     out_path=spec.out_path,
@@ -517,19 +677,49 @@ class AbstractDaskEvalPackage(AbstractEvalPackage):
                     surf_only=True,
                 )
             )
-            op.run()
+            if spec.out_path.exists():
+                if self.run_mode != RunMode.RESUME:
+                    LOGGER(exc_info=FileExistsError(f"{spec.out_path=} already exists."))
+                elif op.is_up_to_date():
+                    LOGGER(f"{spec.out_path=} is up to date and {self.run_mode=}. skipping.")
+                    continue
+                else:
+                    LOGGER(f"{spec.out_path=} is stale or incomplete. rerunning.")
+            LOGGER(f"running dask operation {spec.out_path=}")
+            ops.append(op)
+        # Operations write distinct output files and are independent. They run in separate processes because the
+        # netCDF library is not safe to use from several threads at once. Workers are spawned rather than forked so
+        # they do not inherit the state of dask or netCDF threads already running in this process.
+        max_workers = max(1, min(SETTINGS.dask_max_concurrent_operations, len(ops)))
+        if max_workers == 1:
+            for op in ops:
+                op.run()
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+                for _ in executor.map(_run_dask_operation_, ops):
+                    pass
 
 
-def package_key_to_class(key: PackageKey) -> type[AbstractEvalPackage]:
+def _run_dask_operation_(op: AbstractDaskOperation) -> None:
+    # Process pool entry point. Discard the computed dataset rather than pickling it back to the parent.
+    op.run()
+
+
+@lru_cache(maxsize=1)
+def _package_classes_() -> dict[PackageKey, type[AbstractEvalPackage]]:
+    # Package modules import this one, so the mapping is built on first lookup rather than at import.
     from .aqs_pm import AQS_PM_EvalPackage
     from .aqs_voc import AQS_VOC_EvalPackage
     from .chem import ChemEvalPackage
     from .ish import ISH_EvalPackage
 
-    mapping: dict[PackageKey, type[AbstractEvalPackage]] = {
+    return {
         PackageKey.CHEM: ChemEvalPackage,
         PackageKey.ISH: ISH_EvalPackage,
         PackageKey.AQS_PM: AQS_PM_EvalPackage,
         PackageKey.AQS_VOC: AQS_VOC_EvalPackage,
     }
-    return mapping[key]
+
+
+def package_key_to_class(key: PackageKey) -> type[AbstractEvalPackage]:
+    return _package_classes_()[key]
@@ -1,5 +1,3 @@
-import dask
-import dask.array
 import numpy as np
 import xarray as xr
 
@@ -15,10 +13,10 @@ class ISH_PreprocessDaskOperation(AbstractDaskOperation):
     phy_varnames: tuple[str, ...] = ("tmp2m", "spfh2m", "ugrd10m", "vgrd10m")
     derived_varnames: tuple[str, ...] = ("vapor", "dew_temp", "ws10m", "wd10m", "rh2m")
 
-    @dask.delayed
     def _compute_derived_fields_(self, ds: xr.Dataset) -> xr.Dataset:
         """
-        Calculate derived variables for ISH meteorological evaluation.
+        Calculate derived variables for ISH meteorological evaluation. All fields are built in the lazy dask graph
+        and evaluated together, chunk-parallel, when the caller computes the dataset.
 
         References:
             https://nco.sourceforge.net/nco.html#Examples-ncap2
@@ -27,24 +25,20 @@ class ISH_PreprocessDaskOperation(AbstractDaskOperation):
             https://sgichuki.github.io/Atmo/
         """
 
-        ds["vapor"] = (ds["spfh2m"] / (1 - ds["spfh2m"])) * ds["pressfc"] / (0.622 + ds["spfh2m"] / (1 - ds["spfh2m"]))
-        ds["vapor"].attrs["long_name"] = "2 meter water vapor pressure"
-        ds["vapor"].attrs["units"] = "Pa"
+        # Shared subexpressions are built once so each appears only once in the task graph.
+        mixing_ratio = ds["spfh2m"] / (1 - ds["spfh2m"])
+        ds["vapor"] = mixing_ratio * ds["pressfc"] / (0.622 + mixing_ratio)
+        ds["vapor"].attrs.update(long_name="2 meter water vapor pressure", units="Pa")
 
-        ds["dew_temp"] = (243.5 * dask.array.log((ds["vapor"] / 100) / 6.112)) / (
-            17.269 - dask.array.log((ds["vapor"] / 100) / 6.112)
-        )
-        ds["dew_temp"].attrs["long_name"] = "2 meter dew point temperature"
-        ds["dew_temp"].attrs["units"] = "C"
+        log_vapor = np.log((ds["vapor"] / 100) / 6.112)
+        ds["dew_temp"] = (243.5 * log_vapor) / (17.269 - log_vapor)
+        ds["dew_temp"].attrs.update(long_name="2 meter dew point temperature", units="C")
 
-        ds["ws10m"] = dask.array.sqrt(ds["ugrd10m"] * ds["ugrd10m"] + ds["vgrd10m"] * ds["vgrd10m"])
-        ds["ws10m"].attrs["long_name"] = "10 meter wind speed"
-        ds["ws10m"].attrs["units"] = "m/s"
+        ds["ws10m"] = np.hypot(ds["ugrd10m"], ds["vgrd10m"])
+        ds["ws10m"].attrs.update(long_name="10 meter wind speed", units="m/s")
 
-        ds["wd10m"] = 270 - (dask.array.arctan2(ds["vgrd10m"], ds["ugrd10m"]) * 180 / 3.1415)
-        ds["wd10m"] = xr.where(ds["wd10m"] > 360, ds["wd10m"] - 360, ds["wd10m"])
-        ds["wd10m"].attrs["long_name"] = "10 meter wind direction"
-        ds["wd10m"].attrs["units"] = "degree"
+        ds["wd10m"] = np.mod(270.0 - np.degrees(np.arctan2(ds["vgrd10m"], ds["ugrd10m"])), 360.0)
+        ds["wd10m"].attrs.update(long_name="10 meter wind direction", units="degree")
 
         # Convert temperature fields to Celsius
         ds["tmp"] -= 273.15
@@ -55,17 +49,19 @@ class ISH_PreprocessDaskOperation(AbstractDaskOperation):
         # Calculate RH from specific humidity per Zach Moon's calc-met.py (spike/calc-met.py)
         #   Note: ds["spfh2m"].attrs["units"] == "kg/kg"
         pres = 1000_00  # Pa
-        e_s = 6.1094 * 100 * dask.array.exp(17.625 * ds["tmp2m"] / (ds["tmp2m"] + 243.04))  # saturation VP; Pa
+        e_s = 6.1094 * 100 * np.exp(17.625 * ds["tmp2m"] / (ds["tmp2m"] + 243.04))  # saturation VP; Pa
         w_s = 0.622 * e_s / pres
-        rh = 100 * ds["spfh2m"] / w_s
-        if not (rh.min() > 0 and rh.quantile(0.9) < 100):
-            raise ValueError(f"rh quantile check failed: {rh.quantile(0.9)=}")
-        rh = rh.astype(np.float32)
-        ds["rh2m"] = rh
+        ds["rh2m"] = 100 * ds["spfh2m"] / w_s
         ds["rh2m"].attrs.update(long_name="2-m relative humidity", units="%")
 
         return ds
 
+    def _finalize_derived_fields_(self, ds: xr.Dataset) -> None:
+        # The quantile check needs the whole field, so it runs on the computed values (before the float32 cast).
+        rh = ds["rh2m"]
+        if not (rh.min() > 0 and rh.quantile(0.9) < 100):
+            raise ValueError(f"rh quantile check failed: {rh.quantile(0.9)=}")
+
 
 class ISH_EvalPackage(AbstractDaskEvalPackage):
     """Defines an ISH (Integrated Surface Hourly) meteorological evaluation package."""
@@ -39,10 +39,3 @@ class Analysis(AeBaseModel):
         if self.save is not None and self.read is not None:
             raise ValueError("Only one of save or read can be set.")
         return self
-
-
-class SavePairedTask(AeBaseModel):
-    analysis: Analysis
-
-    def to_yaml(self) -> dict:
-        return self.model_dump(mode="json")
@@ -6,7 +6,7 @@ from pathlib import Path
 import typer
 
 from aqm_eval.mm_eval.driver.config import PackageKey
-from aqm_eval.mm_eval.driver.package.core import package_key_to_class
+from aqm_eval.mm_eval.driver.package.core import AbstractEvalPackage, package_key_to_class
 from aqm_eval.mm_eval.rocoto.srw_task_group import srw_data_to_json
 from aqm_eval.mm_eval.stats_concat import StatsFileCollection
 
@@ -14,6 +14,14 @@ os.environ["NO_COLOR"] = "1"
 app = typer.Typer(pretty_exceptions_enable=False)
 
 
+def _create_srw_package_(expt_dir: Path, package_selector: PackageKey) -> AbstractEvalPackage:
+    from aqm_eval.mm_eval.driver.context.srw import SRWContext
+
+    ctx = SRWContext.from_expt_dir(expt_dir)
+    klass = package_key_to_class(package_selector)
+    return klass.model_validate(dict(ctx=ctx))
+
+
 @app.command(
     name="srw-init",
     help="Initialize the MELODIES MONET UFS-AQM evaluation from the SRW workflow.",
@@ -22,11 +30,7 @@ def srw_init(
     expt_dir: Path = typer.Option(..., "--expt-dir", help="Experiment directory."),
     package_selector: PackageKey = typer.Option(..., "--package", help="Package selector."),
 ) -> None:
-    from aqm_eval.mm_eval.driver.context.srw import SRWContext
-
-    ctx = SRWContext.from_expt_dir(expt_dir)
-    klass = package_key_to_class(package_selector)
-    package = klass.model_validate(dict(ctx=ctx))
+    package = _create_srw_package_(expt_dir, package_selector)
     package.initialize()
 
 
@@ -39,11 +43,7 @@ def srw_run(
     package_selector: PackageKey = typer.Option(..., "--package", help="Package selector."),
     task_selector: str = typer.Option(..., "--task", help="Task selector."),
 ) -> None:
-    from aqm_eval.mm_eval.driver.context.srw import SRWContext
-
-    ctx = SRWContext.from_expt_dir(expt_dir)
-    klass = package_key_to_class(package_selector)
-    package = klass.model_validate(dict(ctx=ctx))
+    package = _create_srw_package_(expt_dir, package_selector)
     package.run(task_label=task_selector)
 
 
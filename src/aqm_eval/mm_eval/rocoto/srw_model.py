@@ -150,6 +150,13 @@ class AqmTaskGroup(AeBaseModel):
         packages = []
         tasks = []
         active_package_keys = []
+        enable_scorecards = config.aqm.enable_scorecards
+        # Scorecard task labels depend only on the config, so build them once for all packages.
+        scorecard_task_labels = tuple(
+            f"{TaskKey.SCORECARD.value}_{scorecard_method.value}_{scorecard_cfg.key}"
+            for scorecard_cfg in config.aqm.scorecards.values()
+            for scorecard_method in ScorecardMethod
+        )
         for package in config.aqm.packages.values():
             if package.active:
                 package_batchargs = package.execution.prep.batchargs
@@ -161,26 +168,25 @@ class AqmTaskGroup(AeBaseModel):
                 }
                 packages.append(AqmPrep.model_validate(data))
                 package_class = package_key_to_class(package.key)
+                tasks_to_exclude = set(package.tasks_to_exclude)
                 for task_key in package_class.model_fields["tasks_default"].default:
-                    if not config.aqm.enable_scorecards and task_key == TaskKey.SCORECARD:
+                    if not enable_scorecards and task_key == TaskKey.SCORECARD:
                         continue
-                    if task_key not in package.tasks_to_exclude:
+                    if task_key not in tasks_to_exclude:
                         if task_key == TaskKey.STATS:
                             active_package_keys.append(package.key)
                         task_batchargs = package.execution.tasks.get(task_key, config.aqm.task_defaults.execution).batchargs
                         if task_key == TaskKey.SCORECARD:
-                            for scorecard_cfg in config.aqm.scorecards.values():
-                                for scorecard_method in ScorecardMethod:
-                                    task_label = f"{TaskKey.SCORECARD.value}_{scorecard_method.value}_{scorecard_cfg.key}"
-                                    data = {
-                                        "node_count": str(task_batchargs.nodes),
-                                        "walltime": task_batchargs.walltime,
-                                        "package_key": package.key,
-                                        "task_key": task_key,
-                                        "task_label": task_label,
-                                        "nprocs": str(task_batchargs.tasks_per_node),
-                                    }
-                                    tasks.append(AqmEvalTask.model_validate(data))
+                            for task_label in scorecard_task_labels:
+                                data = {
+                                    "node_count": str(task_batchargs.nodes),
+                                    "walltime": task_batchargs.walltime,
+                                    "package_key": package.key,
+                                    "task_key": task_key,
+                                    "task_label": task_label,
+                                    "nprocs": str(task_batchargs.tasks_per_node),
+                                }
+                                tasks.append(AqmEvalTask.model_validate(data))
                         else:
                             data = {
                                 "node_count": str(task_batchargs.nodes),
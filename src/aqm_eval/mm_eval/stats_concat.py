@@ -1,4 +1,6 @@
 import datetime
+import fnmatch
+import os
 import re
 from pathlib import Path
 
@@ -9,6 +11,11 @@ from aqm_eval.base import AeBaseModel
 from aqm_eval.logging_aqm_eval import LOGGER
 from aqm_eval.mm_eval.driver.config import PackageKey
 
+_STATS_FILENAME_PATTERN = re.compile(
+    "stats\.(?P<variable>.+)\.(?P<region_type>all|epa_region|country)\.(?P<region_id>.+)\.(?P<start_date>[0-9-_]+)\.(?P<end_date>[0-9-_]+)\.csv"
+)
+_STATS_FILENAME_MATCH = re.compile(fnmatch.translate("stats.*.csv"))
+
 
 class StatsFile(AeBaseModel):
     variable: str
@@ -21,10 +28,7 @@ class StatsFile(AeBaseModel):
 
     @classmethod
     def from_path(cls, path: Path, package_key: PackageKey | None = None) -> "StatsFile":
-        pattern = re.compile(
-            "stats\.(?P<variable>.+)\.(?P<region_type>all|epa_region|country)\.(?P<region_id>.+)\.(?P<start_date>[0-9-_]+)\.(?P<end_date>[0-9-_]+)\.csv"
-        )
-        match = re.match(pattern, path.name)
+        match = _STATS_FILENAME_PATTERN.match(path.name)
         if match is None:
             raise ValueError
         data = match.groupdict()
@@ -37,10 +41,11 @@ class StatsFile(AeBaseModel):
     def as_dataframe(self) -> pd.DataFrame:
         df = pd.read_csv(self.path)
         id_vars = ("Stat_ID", "Stat_FullName")
-        value_vars = tuple(set(df.columns) - set(id_vars))
+        value_vars = [ii for ii in df.columns if ii not in id_vars]
         df = df.melt(id_vars=id_vars, value_vars=value_vars, var_name="model", value_name="value")
-        for k, v in self.model_dump().items():
-            df[k] = v
+        # All fields are scalars, so read them directly rather than going through the serializer per file.
+        for k in type(self).model_fields:
+            df[k] = getattr(self, k)
         return df
 
     @field_validator("path", mode="before")
@@ -57,18 +62,28 @@ class StatsFileCollection(AeBaseModel):
     @classmethod
     def from_dir(cls, path: Path) -> "StatsFileCollection":
         stats_files = []
-        for path in path.rglob("**/stats.*.csv"):
-            package_key = None
-            for ii in PackageKey:
-                if ii.value in path.parts:
-                    package_key = ii
-                    break
-            LOGGER(f"parsing {path=}, {package_key=}")
-            sfile = StatsFile.from_path(path, package_key=package_key)
-            LOGGER(f"found stats file: {sfile}")
-            stats_files.append(sfile)
+        # ``os.walk`` reuses the entry types from each directory read instead of stat-ing every entry.
+        for root, _, filenames in os.walk(path):
+            for filename in filenames:
+                if _STATS_FILENAME_MATCH.match(filename) is None:
+                    continue
+                stats_files.append(cls._parse_stats_file_(Path(root, filename)))
         return cls(stats_files=tuple(stats_files))
 
+    @staticmethod
+    def _parse_stats_file_(path: Path) -> StatsFile:
+        package_key = None
+        # Route on a set of the path components so each package key is an O(1) membership check.
+        parts = set(path.parts)
+        for ii in PackageKey:
+            if ii.value in parts:
+                package_key = ii
+                break
+        LOGGER(f"parsing {path=}, {package_key=}")
+        sfile = StatsFile.from_path(path, package_key=package_key)
+        LOGGER(f"found stats file: {sfile}")
+        return sfile
+
     def as_dataframe(self) -> pd.DataFrame:
         dfs = [sfile.as_dataframe() for sfile in self.stats_files]
         for df in dfs:
@@ -30,6 +30,9 @@ class AQM_EvalSettings(BaseSettings):
     slurm_ntasks_per_node: int = 1
     slurm_nnodes: int = 1
 
+    dask_max_concurrent_operations: int = 1
+    nccmp_max_concurrent_processes: int = 1
+
     @computed_field
     @cached_property
     def dask_num_workers(self) -> int:
@@ -1,56 +1,72 @@
 import datetime
 import logging
+import os
 import subprocess
 from copy import deepcopy
 from pathlib import Path
 from typing import Annotated, Any, Iterator, Mapping
 
 import numpy as np
+import yaml
 from pydantic import BeforeValidator, PlainSerializer
 
 from aqm_eval.base import AeBaseModel
 from aqm_eval.logging_aqm_eval import LOGGER
 
+# Prefer the libyaml-backed loader and dumper when PyYAML was built with them.
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_SAFE_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def assert_path_exists(path: Path | str) -> Path:
     path = Path(path)
-    if not path.exists():
+    if not os.path.exists(path):
         LOGGER(exc_info=FileNotFoundError(f"path does not exist: {path}"))
     return path
 
 
-PathExisting = Annotated[Path, BeforeValidator(assert_path_exists), PlainSerializer(lambda x: str(x), return_type=str)]
+PathExisting = Annotated[Path, BeforeValidator(assert_path_exists), PlainSerializer(os.fspath, return_type=str)]
 
 
 def assert_directory_exists(path: Path | str) -> PathExisting:
-    path = assert_path_exists(path)
-    if not path.is_dir():
+    path = Path(path)
+    # A single stat covers the common case; the failure mode is only distinguished when the check fails.
+    if not os.path.isdir(path):
+        assert_path_exists(path)
         LOGGER(exc_info=ValueError(f"path is not a directory: {path}"))
     return path
 
 
-PathExistingDir = Annotated[Path, BeforeValidator(assert_directory_exists), PlainSerializer(lambda x: str(x), return_type=str)]
+PathExistingDir = Annotated[Path, BeforeValidator(assert_directory_exists), PlainSerializer(os.fspath, return_type=str)]
+
+
+def resolve_path(path: Path) -> Path:
+    # Canonicalizes ``..`` and symlinks anywhere in the path, and raises if the path does not exist.
+    return path.resolve(strict=True)
 
 
 def get_or_create_path(path: str | Path, **kwargs: Any) -> Path:
     path = Path(path)
-    if not path.exists():
-        LOGGER(f"creating path: {path}", level=logging.DEBUG)
-        defaults = dict(exist_ok=True, parents=True)
-        defaults.update(kwargs)
-        path.mkdir(**defaults)
+    # A single ``mkdir`` both checks for and creates the path, avoiding a separate ``stat`` for existing paths.
+    mkdir_kwargs = {"parents": True, **kwargs, "exist_ok": False}
+    try:
+        path.mkdir(**mkdir_kwargs)
+    except FileExistsError:
+        return path
+    LOGGER(f"created path: {path}", level=logging.DEBUG)
     return path
 
 
 def assert_file_exists(path: Path | str) -> Path:
-    path = assert_path_exists(path)
-    if not path.is_file():
+    path = Path(path)
+    if not os.path.isfile(path):
+        assert_path_exists(path)
         LOGGER(exc_info=ValueError(f"path is not a file: {path}"))
     return path
 
 
 def ncdump(path: Path) -> None:
-    result = subprocess.check_output(["ncdump", "-h", str(path)])
+    result = subprocess.check_output(["ncdump", "-h", os.fspath(path)])
     print(result.decode())
 
 
@@ -80,21 +96,12 @@ class DateRange(AeBaseModel):
 
 
 def update_left(data_left: dict, data_right: dict) -> None:
-    for key, value in data_right.items():
-        if isinstance(data_left.get(key), Mapping):
-            update_left(data_left[key], value)
-        else:
-            data_left[key] = value
-
-
-def get_str_nested(data: dict, key: str) -> Any:
-    for k in key.split("."):
-        data = data[k]
-    return data
-
-
-def set_str_nested(data: dict, key: str, value: Any) -> None:
-    keys = key.split(".")
-    for key in keys[:-1]:
-        data = data[key]
-    data[keys[-1]] = value
+    # Merge with an explicit stack rather than recursion to avoid per-level frame overhead on nested configs.
+    stack = [(data_left, data_right)]
+    while stack:
+        curr_left, curr_right = stack.pop()
+        for key, value in curr_right.items():
+            if isinstance(curr_left.get(key), Mapping):
+                stack.append((curr_left[key], value))
+            else:
+                curr_left[key] = value
@@ -1,10 +1,10 @@
-from functools import cached_property
+import os
 from pathlib import Path
 from typing import Iterator
 
 from pydantic import Field
 
-from aqm_eval.base import AeBaseModel
+from aqm_eval.base import AeBaseModel, fast_cached_property
 
 
 class VerifyPair(AeBaseModel):
@@ -27,7 +27,7 @@ class VerifyContext(AeBaseModel):
     verbose: bool = True
     fail_fast: bool = False
 
-    @cached_property
+    @fast_cached_property
     def verify_pairs_full_path(self) -> tuple[VerifyPair, ...]:
         ret = []
         for verify_pair in self.verify_pairs:
@@ -45,10 +45,9 @@ class VerifyContext(AeBaseModel):
         return tuple(ret)
 
     def iter_nccmp_cmds(self) -> Iterator[tuple[str, ...]]:
+        # The flags and tolerance are shared by every pair, so only the variables and paths change per command.
+        prefix = ("nccmp", "--verbose") if self.verbose else ("nccmp",)
+        tolerance = str(self.tolerance)
         for verify_pair in self.verify_pairs_full_path:
-            cmd = ["nccmp"]
-            if self.verbose:
-                cmd.append("--verbose")
             v = ",".join(verify_pair.variables)
-            cmd += ["-d", "-m", "-v", v, "-t", str(self.tolerance), str(verify_pair.actual), str(verify_pair.expected)]
-            yield tuple(cmd)
+            yield (*prefix, "-d", "-m", "-v", v, "-t", tolerance, os.fspath(verify_pair.actual), os.fspath(verify_pair.expected))
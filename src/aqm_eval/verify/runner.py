@@ -1,7 +1,11 @@
 import logging
 import subprocess
+import tempfile
+from collections import deque
+from typing import IO
 
 from aqm_eval.logging_aqm_eval import LOGGER
+from aqm_eval.settings import SETTINGS
 from aqm_eval.verify.context import VerifyContext
 
 
@@ -11,16 +15,37 @@ class NccmpError(Exception): ...
 def run_verify(ctx: VerifyContext) -> None:
     LOGGER(ctx.model_dump_json())
     error_ctr = 0
-    for cmd in ctx.iter_nccmp_cmds():
-        LOGGER(str(cmd))
-        try:
-            subprocess.check_call(cmd)
-            LOGGER("verify successful")
-        except subprocess.CalledProcessError:
-            error_ctr += 1
-            if ctx.fail_fast:
-                LOGGER(exc_info=NccmpError("verify failed, see above for error info"))
-            else:
-                LOGGER("verify failed, but fail_fast is False so continuing", level=logging.WARNING)
+    # Comparisons are independent child processes, so keep up to ``nccmp_max_concurrent_processes`` in flight and
+    # collect return codes oldest first. Each process writes to its own file so concurrent output never interleaves.
+    max_in_flight = max(SETTINGS.nccmp_max_concurrent_processes, 1)
+    in_flight: deque[tuple[tuple[str, ...], subprocess.Popen, IO[bytes]]] = deque()
+    try:
+        for cmd in ctx.iter_nccmp_cmds():
+            if len(in_flight) >= max_in_flight:
+                error_ctr += _wait_nccmp_(*in_flight.popleft(), fail_fast=ctx.fail_fast)
+            output: IO[bytes] = tempfile.TemporaryFile()
+            in_flight.append((cmd, subprocess.Popen(cmd, stdout=output, stderr=subprocess.STDOUT), output))
+        while in_flight:
+            error_ctr += _wait_nccmp_(*in_flight.popleft(), fail_fast=ctx.fail_fast)
+    finally:
+        for _, proc, output in in_flight:
+            proc.kill()
+            proc.wait()
+            output.close()
     if error_ctr > 0:
         LOGGER(exc_info=NccmpError(f"verify failed with {error_ctr=}, see above for error info"))
+
+
+def _wait_nccmp_(cmd: tuple[str, ...], proc: subprocess.Popen, output: IO[bytes], fail_fast: bool) -> int:
+    with output:
+        returncode = proc.wait()
+        output.seek(0)
+        LOGGER(f"{cmd}\n{output.read().decode(errors='replace')}")
+    if returncode == 0:
+        LOGGER("verify successful")
+        return 0
+    if fail_fast:
+        LOGGER(exc_info=NccmpError(f"verify failed for {cmd}, see above for error info"))
+    else:
+        LOGGER("verify failed, but fail_fast is False so continuing", level=logging.WARNING)
+    return 1
@@ -4,6 +4,7 @@ from pathlib import Path
 import typer
 import yaml
 
+from aqm_eval.shared import YAML_SAFE_LOADER
 from aqm_eval.verify.context import VerifyContext
 from aqm_eval.verify.runner import run_verify
 
@@ -22,7 +23,8 @@ def aqm_verify(
         "aqm-verify", "--root-key", help="If provided, use this key when extracting the root configuration"
     ),
 ) -> None:
-    yaml_data = yaml.safe_load(yaml_path.read_text())
+    with open(yaml_path, "rb") as f:
+        yaml_data = yaml.load(f, Loader=YAML_SAFE_LOADER)
     ctx = VerifyContext.model_validate(yaml_data[root_key])
     run_verify(ctx)
 
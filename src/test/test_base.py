@@ -0,0 +1,19 @@
+from aqm_eval.base import AeBaseModel, fast_cached_property
+
+
+class _Model(AeBaseModel):
+    value: int
+
+    @fast_cached_property
+    def _doubled(self) -> list[int]:
+        return [self.value * 2]
+
+
+def test_fast_cached_property() -> None:
+    model = _Model(value=2)
+    assert "_doubled" not in model.__dict__
+    doubled = model._doubled
+    assert doubled == [4]
+    assert model._doubled is doubled
+    assert model.model_dump() == {"value": 2}
+    assert model == _Model(value=2)
@@ -0,0 +1,14 @@
+import logging
+
+from aqm_eval.logging_aqm_eval import LOGGER
+
+
+def test_is_enabled_for() -> None:
+    logger = LOGGER._get_logger_()
+    original = logger.level
+    try:
+        logger.setLevel(logging.INFO)
+        assert LOGGER.is_enabled_for(logging.INFO)
+        assert not LOGGER.is_enabled_for(logging.DEBUG)
+    finally:
+        logger.setLevel(original)
@@ -6,7 +6,7 @@ import yaml
 from box import Box
 from pydantic_core import ValidationError
 
-from aqm_eval.mm_eval.driver.config import Config, PackageConfig, PackageKey, PlatformKey, TaskKey
+from aqm_eval.mm_eval.driver.config import AQMModelConfig, Config, PackageConfig, PackageKey, PlatformKey, TaskKey
 from test.test_mm_eval.conftest import PackageConfigFactory
 
 
@@ -27,6 +27,15 @@ def test(config: Config, tmp_path: Path) -> None:
     _ = Config.from_yaml(data)
 
 
+@pytest.mark.parametrize("title", [None, "A Title"])
+def test_aqm_model_config_title(tmp_path: Path, title: str | None) -> None:
+    data = {"key": "foo", "expt_dir": tmp_path, "plot_kwargs": {}}
+    if title is not None:
+        data["title"] = title
+    actual = AQMModelConfig.model_validate(data)
+    assert actual.title == ("foo" if title is None else title)
+
+
 def test_json_schema() -> None:
     schema = Config.model_json_schema()
     pretty_json = json.dumps(schema, indent=2)
@@ -98,3 +107,9 @@ def test_aqm_config_validate_model_after_no_shared_model_stems(config: Config) -
     with pytest.raises(ValidationError) as exc_info:
         _ = Config.model_validate(data)
     assert "Model stems must be unique for wildcard selections" in str(exc_info.value)
+
+
+def test_config_get_default_yaml_returns_copy() -> None:
+    data = Config.get_default_yaml()
+    data[Config.get_key()]["aqm"]["models"].clear()
+    assert len(Config.get_default_yaml()[Config.get_key()]["aqm"]["models"]) > 0
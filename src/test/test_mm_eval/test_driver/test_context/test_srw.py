@@ -1,4 +1,9 @@
-from aqm_eval.mm_eval.driver.context.srw import SRWContext
+from datetime import datetime
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+from aqm_eval.mm_eval.driver.context.srw import SRWContext, _format_mm_datetime_, _load_yaml_, _load_yaml_cached_
 
 
 def test() -> None:
@@ -54,3 +59,51 @@ def test() -> None:
         },
     }
     _ = SRWContext.model_validate(data)
+
+
+def test_from_expt_dir_caches_yaml(srw_context: SRWContext) -> None:
+    hits = _load_yaml_cached_.cache_info().hits
+    actual = SRWContext.from_expt_dir(srw_context.expt_dir)
+    assert _load_yaml_cached_.cache_info().hits == hits + 1
+    assert actual.melodies_monet_parm == srw_context.melodies_monet_parm
+
+    # Modifying the file invalidates the cached parse.
+    var_defns = srw_context.expt_dir / "var_defns.yaml"
+    var_defns.write_text(var_defns.read_text() + "\n")
+    misses = _load_yaml_cached_.cache_info().misses
+    _ = SRWContext.from_expt_dir(srw_context.expt_dir)
+    assert _load_yaml_cached_.cache_info().misses == misses + 1
+
+
+def test_load_yaml_falls_back_to_uwtools_for_tags(tmp_path: Path, mocker: MockerFixture) -> None:
+    path = tmp_path / "var_defns.yaml"
+    path.write_text("a: 1\n")
+    assert _load_yaml_(path) == {"a": 1}
+
+    path.write_text("a: !int '2'\n")
+    mocked = mocker.patch("aqm_eval.mm_eval.driver.context.srw.get_yaml_config")
+    mocked.return_value.data = {"a": 2}
+    assert _load_yaml_(path) == {"a": 2}
+    mocked.assert_called_once_with(path)
+
+
+def test_format_mm_datetime() -> None:
+    dt = datetime(2023, 8, 1, 6)
+    assert _format_mm_datetime_(dt) == dt.strftime("%Y-%m-%d-%H:00:00") == "2023-08-01-06:00:00"
+
+
+def test_eager_validate_disabled(srw_context: SRWContext) -> None:
+    class LazySRWContext(SRWContext):
+        _eager_validate = False
+
+    data = srw_context.model_dump(include={"workflow", "platform", "user"})
+    data["melodies_monet_parm"] = {}
+    ctx = LazySRWContext.model_validate(data)
+    assert "mm_config" not in ctx.__dict__
+
+
+def test_eager_properties_evaluated_on_validate(srw_context: SRWContext) -> None:
+    data = srw_context.model_dump(include={"workflow", "platform", "user", "melodies_monet_parm"})
+    ctx = SRWContext.model_validate(data)
+    for name in SRWContext._eager_properties:
+        assert name in ctx.__dict__
@@ -0,0 +1,41 @@
+import datetime
+from pathlib import Path
+
+from aqm_eval.mm_eval.driver.helpers import create_symlinks
+from aqm_eval.shared import DateRange
+
+
+def test_create_symlinks(tmp_path: Path) -> None:
+    src_dir = tmp_path / "expt"
+    for cycle in ["2023080112", "2023080212"]:
+        cycle_dir = src_dir / cycle
+        cycle_dir.mkdir(parents=True)
+        for fn in ["dynf001.nc", "dynf002.nc", "phyf001.nc"]:
+            (cycle_dir / fn).touch()
+    dst_dir = tmp_path / "links" / "data"
+    date_range = DateRange(start=datetime.datetime(2023, 8, 1, 12), end=datetime.datetime(2023, 8, 2, 12))
+
+    create_symlinks(src_dir, dst_dir, "model", date_range, ("dynf*.nc",))
+    expected = {
+        "model_2023080112_dynf001.nc",
+        "model_2023080112_dynf002.nc",
+        "model_2023080212_dynf001.nc",
+        "model_2023080212_dynf002.nc",
+    }
+    assert {ii.name for ii in dst_dir.iterdir()} == expected
+
+    # Existing links are left in place on a second pass.
+    create_symlinks(src_dir, dst_dir, "model", date_range, ("dynf*.nc", "phyf*.nc"))
+    expected.update({"model_2023080112_phyf001.nc", "model_2023080212_phyf001.nc"})
+    assert {ii.name for ii in dst_dir.iterdir()} == expected
+
+
+def test_create_symlinks_no_templates(tmp_path: Path) -> None:
+    cycle_dir = tmp_path / "expt" / "2023080112"
+    cycle_dir.mkdir(parents=True)
+    (cycle_dir / "dynf001.nc").touch()
+    dst_dir = tmp_path / "data"
+    date_range = DateRange(start=datetime.datetime(2023, 8, 1, 12), end=datetime.datetime(2023, 8, 1, 12))
+
+    create_symlinks(tmp_path / "expt", dst_dir, "model", date_range, ())
+    assert list(dst_dir.iterdir()) == []
@@ -1,3 +1,4 @@
+import os
 from functools import cached_property
 from pathlib import Path
 from typing import Any
@@ -7,8 +8,9 @@ import pytest
 import xarray as xr
 from pydantic import BaseModel
 
+from aqm_eval.mm_eval.driver.package import core
 from aqm_eval.mm_eval.driver.package.aqs_pm import AQS_PM_PreprocessDaskOperation
-from aqm_eval.mm_eval.driver.package.core import AbstractDaskOperation, ForecastFileSpec
+from aqm_eval.mm_eval.driver.package.core import AbstractDaskOperation, ForecastFileSpec, _drop_compression_encoding_
 from aqm_eval.mm_eval.driver.package.ish import ISH_PreprocessDaskOperation
 from aqm_eval.shared import PathExisting
 from test.shared import create_data_array
@@ -109,8 +111,111 @@ def test(tmp_path: Path, klass: type[AbstractDaskOperation], surf_only: bool) ->
     expected_vars = set(result.data_vars)
     expected_vars.update({"pfull"})
     assert expected_vars == set(test_ctx.op.dyn_varnames + test_ctx.op.phy_varnames + test_ctx.op.derived_varnames)
+    for ii in test_ctx.op.derived_varnames:
+        assert result[ii].dtype == np.float32
     actual_attrs = result.attrs.copy()
     for ii in ["ak", "bk"]:
         actual_attrs[ii] = actual_attrs[ii].tolist()
     assert actual_attrs == test_ctx.expected_global_attrs
+    assert test_ctx.op.is_up_to_date()
+    test_ctx.op.out_path.unlink()
+    assert not test_ctx.op.is_up_to_date()
+    os.utime(test_ctx.op.dyn_path[0], ns=(0, 0))
+    assert not klass.model_validate(test_ctx.op.model_dump()).is_up_to_date()
     result.to_netcdf(test_ctx.op.out_path)
+
+
+def test_fingerprint_tracks_version_and_parameters(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    dyn_path = tmp_path / "dynf001.nc"
+    dyn_path.write_bytes(b"dyn")
+    phy_path = tmp_path / "phyf001.nc"
+    phy_path.write_bytes(b"phy")
+    data = dict(out_path=tmp_path / "out.nc", dyn_path=(dyn_path,), phy_path=(phy_path,), dask_num_workers=1, surf_only=True)
+    op = ISH_PreprocessDaskOperation.model_validate(data)
+    op.out_path.touch()
+    op.fingerprint_path.write_text(op.input_fingerprint)
+    assert op.is_up_to_date()
+    # Scheduler sizing does not change the written values.
+    assert ISH_PreprocessDaskOperation.model_validate({**data, "dask_num_workers": 4}).is_up_to_date()
+    assert not ISH_PreprocessDaskOperation.model_validate({**data, "surf_only": False}).is_up_to_date()
+    assert not ISH_PreprocessDaskOperation.model_validate({**data, "chunks": "auto"}).is_up_to_date()
+    monkeypatch.setattr(core, "_FINGERPRINT_VERSION", core._FINGERPRINT_VERSION + 1)
+    assert not ISH_PreprocessDaskOperation.model_validate(data).is_up_to_date()
+
+
+def test_open_dataset_concatenates_invariant_fields(tmp_path: Path) -> None:
+    dims = {"time": 1, "pfull": 2, "grid_yt": 4, "grid_xt": 3}
+    for ii in range(3):
+        ds = xr.Dataset(
+            {
+                "tmp": create_data_array("tmp", dims),
+                "hgtsfc": create_data_array("hgtsfc", {"grid_yt": 4, "grid_xt": 3}),
+                "unused": create_data_array("unused", dims),
+            }
+        )
+        ds.to_netcdf(tmp_path / f"dynf{ii}.nc")
+    spec = ForecastFileSpec(src_dir=tmp_path, out_dir=tmp_path, out_prefix="test")
+    op = ISH_PreprocessDaskOperation(
+        out_path=tmp_path / "out.nc", dyn_path=spec.dyn_path, phy_path=spec.phy_path, dask_num_workers=1, surf_only=False
+    )
+    actual = op._open_dataset_("dyn_path")
+    try:
+        assert actual["tmp"].sizes["time"] == 2
+        assert actual["hgtsfc"].sizes["time"] == 2
+        assert "unused" not in actual
+    finally:
+        actual.close()
+
+
+def test_forecast_file_spec_paths(tmp_path: Path) -> None:
+    for fn in ["dynf002.nc", "dynf000.nc", "dynf001.nc", "phyf001.nc", "phyf000.nc", "dynf001.nc.tmp"]:
+        (tmp_path / fn).touch()
+    (tmp_path / "dynf003.nc").mkdir()
+    spec = ForecastFileSpec(src_dir=tmp_path, out_dir=tmp_path, out_prefix="test")
+    assert spec.dyn_path == (tmp_path / "dynf001.nc", tmp_path / "dynf002.nc")
+    assert spec.phy_path == (tmp_path / "phyf001.nc",)
+
+
+def test_drop_compression_encoding(tmp_path: Path) -> None:
+    path = tmp_path / "in.nc"
+    xr.Dataset({"tmp": create_data_array("tmp", {"time": 1, "grid_yt": 4})}).to_netcdf(
+        path, encoding={"tmp": {"zlib": True, "complevel": 4}}
+    )
+    with xr.open_dataset(path) as ds:
+        assert ds["tmp"].encoding["zlib"]
+        _drop_compression_encoding_(ds)
+        assert "zlib" not in ds["tmp"].encoding
+        assert "complevel" not in ds["tmp"].encoding
+        ds.to_netcdf(tmp_path / "out.nc")
+    with xr.open_dataset(tmp_path / "out.nc") as actual:
+        assert not actual["tmp"].encoding["zlib"]
+
+
+def test_ish_wind_fields(tmp_path: Path) -> None:
+    dims = {"time": 1, "grid_yt": 2, "grid_xt": 2}
+    fields = {ii: create_data_array(ii, dims) for ii in ISH_PreprocessDaskOperation.model_fields["dyn_varnames"].default}
+    fields.update({ii: create_data_array(ii, dims) for ii in ISH_PreprocessDaskOperation.model_fields["phy_varnames"].default})
+    ds = xr.Dataset(fields)
+    ds["ugrd10m"][:] = np.array([[1.0, 0.0], [-1.0, 0.0]])
+    ds["vgrd10m"][:] = np.array([[0.0, 1.0], [0.0, -1.0]])
+    op = ISH_PreprocessDaskOperation(out_path=tmp_path / "out.nc", dyn_path=(), phy_path=(), dask_num_workers=1, surf_only=True)
+    actual = op._compute_derived_fields_(ds)
+    np.testing.assert_allclose(actual["ws10m"].values, np.ones((1, 2, 2)))
+    # Meteorological convention: the direction the wind blows from.
+    np.testing.assert_allclose(actual["wd10m"].values, np.array([[[270.0, 180.0], [90.0, 0.0]]]))
+
+
+def test_aqs_pm_organic_carbon_fields(tmp_path: Path) -> None:
+    dims = {"time": 1, "grid_yt": 2, "grid_xt": 2}
+    names = AQS_PM_PreprocessDaskOperation.model_fields["dyn_varnames"].default
+    names += AQS_PM_PreprocessDaskOperation.model_fields["phy_varnames"].default
+    ds = xr.Dataset({ii: create_data_array(ii, dims) for ii in names})
+    op = AQS_PM_PreprocessDaskOperation(out_path=tmp_path / "out.nc", dyn_path=(), phy_path=(), dask_num_workers=1, surf_only=True)
+    actual = op._compute_derived_fields_(ds.copy())
+    air_density = (28.97 * (ds["pressfc"] - ds["dpres"])) / (8.314 * ds["tmp"])
+    poci = 0.001 * (ds["alvpo1i"] / 1.39 + ds["asvpo1i"] / 1.32 + ds["asvpo2i"] / 1.26 + ds["apoci"]) * air_density
+    soci = 0.001 * (ds["alvoo1i"] / 2.27 + ds["alvoo2i"] / 2.06 + ds["asvoo1i"] / 1.88 + ds["asvoo2i"] / 1.73) * air_density
+    np.testing.assert_allclose(actual["poci"].values, poci.values, rtol=1e-12)
+    np.testing.assert_allclose(actual["soci"].values, soci.values, rtol=1e-12)
+    np.testing.assert_allclose(actual["poc"].values, (actual["poci"] + actual["pocj"]).values)
+    np.testing.assert_allclose(actual["soc"].values, (actual["soci"] + actual["socj"]).values)
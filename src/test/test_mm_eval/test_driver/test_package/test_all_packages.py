@@ -1,4 +1,4 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, PropertyMock
 
 import melodies_monet  # type: ignore[import-untyped]
 import pytest
@@ -7,13 +7,17 @@ import yaml
 from pydantic import BaseModel
 from pytest_mock import MockerFixture
 
-from aqm_eval.mm_eval.driver.config import PackageKey, TaskKey
+from aqm_eval.logging_aqm_eval import LOGGER
+from aqm_eval.mm_eval.driver.config import PackageKey, RunMode, TaskKey
 from aqm_eval.mm_eval.driver.context.srw import SRWContext
+from aqm_eval.mm_eval.driver.package import core
 from aqm_eval.mm_eval.driver.package.core import (
+    AbstractDaskEvalPackage,
     AbstractDaskOperation,
     AbstractEvalPackage,
     package_key_to_class,
 )
+from test.shared import create_data_array
 
 
 class AllPackagesTestData(BaseModel):
@@ -108,3 +112,62 @@ def test_all_packages(all_pkgs_test_data: AllPackagesTestData, mocker: MockerFix
     m_analysis.save_analysis.assert_called_once()
 
     assert spy_m_dask_op_run.call_count == all_pkgs_test_data.expected_n_dask_run_calls
+
+
+def fake_run_with_fingerprint(self: AbstractDaskOperation) -> xr.Dataset:
+    self.out_path.touch()
+    self.fingerprint_path.write_text(self.input_fingerprint)
+    return xr.Dataset()
+
+
+def test_existing_outputs_by_run_mode(srw_context: SRWContext, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    package = package_key_to_class(PackageKey.ISH).model_validate(dict(ctx=srw_context))
+    assert isinstance(package, AbstractDaskEvalPackage)
+    _ = mocker.patch.object(AbstractDaskOperation, "run", fake_run_with_fingerprint)
+    spy_m_dask_op_run = mocker.spy(AbstractDaskOperation, "run")
+    m_run_mode = mocker.patch.object(type(package), "run_mode", new_callable=PropertyMock, return_value=RunMode.STRICT)
+    package.link_alldays_path.mkdir(parents=True)
+    package._run_dask_operations_()
+    n_ops = spy_m_dask_op_run.call_count
+    assert n_ops > 0
+
+    with pytest.raises(FileExistsError):
+        package._run_dask_operations_()
+
+    # Without exiting on errors, strict mode logs the existing output and regenerates it even if it is up to date.
+    monkeypatch.setattr(LOGGER, "exit_on_error", False)
+    package._run_dask_operations_()
+    assert spy_m_dask_op_run.call_count == 2 * n_ops
+
+    m_run_mode.return_value = RunMode.RESUME
+    package._run_dask_operations_()
+    assert spy_m_dask_op_run.call_count == 2 * n_ops
+
+
+def test_dask_operations_in_process_pool(srw_context: SRWContext, mocker: MockerFixture) -> None:
+    package = package_key_to_class(PackageKey.ISH).model_validate(dict(ctx=srw_context))
+    assert isinstance(package, AbstractDaskEvalPackage)
+    # Workers run the real operation, so replace the empty forecast files with small valid ones.
+    op_klass = package.klass_dask_operation
+    dims = {"time": 1, "pfull": 2, "grid_yt": 4, "grid_xt": 3}
+    datasets = {
+        "dyn": xr.Dataset({ii: create_data_array(ii, dims) for ii in op_klass.model_fields["dyn_varnames"].default}),
+        "phy": xr.Dataset({ii: create_data_array(ii, dims) for ii in op_klass.model_fields["phy_varnames"].default}),
+    }
+    for model in package.mm_models:
+        for path in model.cfg.expt_dir.glob("*/*f*.nc"):
+            datasets[path.name[0:3]].to_netcdf(path)
+    _ = mocker.patch.object(type(package), "run_mode", new_callable=PropertyMock, return_value=RunMode.STRICT)
+    _ = mocker.patch.object(core, "SETTINGS", core.SETTINGS.model_copy(update={"dask_max_concurrent_operations": 2}))
+    package.link_alldays_path.mkdir(parents=True)
+
+    package._run_dask_operations_()
+
+    specs = tuple(package.iter_forecast_file_specs())
+    assert len(specs) > 1
+    for spec in specs:
+        assert spec.out_path.is_file()
+        op = op_klass.model_validate(
+            dict(out_path=spec.out_path, dyn_path=spec.dyn_path, phy_path=spec.phy_path, dask_num_workers=1, surf_only=True)
+        )
+        assert op.is_up_to_date()
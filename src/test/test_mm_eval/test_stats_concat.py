@@ -81,3 +81,18 @@ def test_from_dir(tmp_path: Path, bin_dir: Path, mm_filenames: tuple[str, ...],
     assert set(out_df.package_key.unique()) == expected_package_key
     for ii in out_df["package_key"].tolist():
         assert ii in expected_package_key
+
+
+def test_from_dir_skips_symlinked_dirs(tmp_path: Path, bin_dir: Path, mm_filenames: tuple[str, ...]) -> None:
+    out_dir = tmp_path / "out" / PackageKey.CHEM.value
+    out_dir.mkdir(parents=True)
+    shutil.copy2(bin_dir / "example-mm-stats.csv", out_dir / mm_filenames[0])
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    shutil.copy2(bin_dir / "example-mm-stats.csv", elsewhere / mm_filenames[1])
+    (out_dir / "linked").symlink_to(elsewhere, target_is_directory=True)
+    # A symlink loop must not recurse either.
+    (out_dir / "loop").symlink_to(out_dir, target_is_directory=True)
+
+    sfile_coll = StatsFileCollection.from_dir(tmp_path / "out")
+    assert [ii.path.name for ii in sfile_coll.stats_files] == [mm_filenames[0]]
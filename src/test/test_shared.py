@@ -2,7 +2,14 @@ from pathlib import Path
 
 import pytest
 
-from aqm_eval.shared import assert_directory_exists, assert_file_exists, calc_2d_chunks
+from aqm_eval.shared import (
+    assert_directory_exists,
+    assert_file_exists,
+    calc_2d_chunks,
+    get_or_create_path,
+    resolve_path,
+    update_left,
+)
 
 
 def test_assert_file_exists_with_valid_file(tmp_path: Path) -> None:
@@ -60,3 +67,39 @@ def test_calc_2d_chunks() -> None:
     n_chunks = 2
     chunks = calc_2d_chunks(dims, n_chunks)
     assert chunks == {"y": 10, "x": 5}
+
+
+def test_resolve_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    target = tmp_path / "target"
+    target.mkdir()
+    link = tmp_path / "link"
+    link.symlink_to(target)
+
+    assert resolve_path(target) == target.resolve()
+    assert resolve_path(link) == target.resolve()
+    assert resolve_path(target / ".." / "target") == target.resolve()
+    (target / "child").mkdir()
+    assert resolve_path(link / "child") == (target / "child").resolve()
+
+    monkeypatch.chdir(tmp_path)
+    assert resolve_path(Path("target")) == target.resolve()
+    with pytest.raises(FileNotFoundError):
+        resolve_path(Path("missing"))
+    with pytest.raises(FileNotFoundError):
+        resolve_path(tmp_path / "missing")
+
+
+def test_get_or_create_path(tmp_path: Path) -> None:
+    target = tmp_path / "a" / "b"
+    assert get_or_create_path(target) == target
+    assert target.is_dir()
+    (target / "sentinel").touch()
+    assert get_or_create_path(str(target), exist_ok=False) == target
+    assert (target / "sentinel").exists()
+
+
+def test_update_left() -> None:
+    left = {"a": 1, "b": {"c": 2, "d": {"e": 3}}, "f": [1]}
+    right = {"b": {"d": {"e": 4, "g": 5}}, "f": [2], "h": {"i": 6}}
+    update_left(left, right)
+    assert left == {"a": 1, "b": {"c": 2, "d": {"e": 4, "g": 5}}, "f": [2], "h": {"i": 6}}
@@ -1,9 +1,12 @@
+import os
 from pathlib import Path
 
 import pytest
 import xarray as xr
 from box import Box
 
+from aqm_eval.settings import SETTINGS
+from aqm_eval.verify import runner
 from aqm_eval.verify.context import VerifyContext, VerifyPair
 from aqm_eval.verify.runner import NccmpError, run_verify
 
@@ -29,3 +32,27 @@ def test_netcdf_values_differ(verify_ctx: VerifyContext, tmp_path: Path, fail_fa
     print(new_verify_ctx)
     with pytest.raises(NccmpError):
         run_verify(new_verify_ctx)
+
+
+@pytest.mark.parametrize("fail_fast", [False, True])
+def test_concurrent_nccmp(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, fail_fast: bool) -> None:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    fake_nccmp = bin_dir / "nccmp"
+    # Stand-in comparing the last two arguments byte for byte.
+    fake_nccmp.write_text('#!/bin/bash\necho "comparing ${@: -2:1}"\ncmp -s "${@: -2:1}" "${@: -1}"\n')
+    fake_nccmp.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setattr(runner, "SETTINGS", SETTINGS.model_copy(update={"nccmp_max_concurrent_processes": 3}))
+
+    (tmp_path / "expected.nc").write_bytes(b"same")
+    pairs = []
+    for ii in range(5):
+        (tmp_path / f"actual{ii}.nc").write_bytes(b"same")
+        pairs.append(VerifyPair(actual=Path(f"actual{ii}.nc"), expected=Path("expected.nc")))
+    ctx = VerifyContext(verify_pairs=tuple(pairs), baseline_dir=tmp_path, expt_dir=tmp_path, fail_fast=fail_fast)
+    run_verify(ctx)
+
+    (tmp_path / "actual1.nc").write_bytes(b"different")
+    with pytest.raises(NccmpError):
+        run_verify(ctx)